@@ -2,32 +2,78 @@
 Shared dependencies for API routes.
 """
 
-from typing import AsyncGenerator
+import time
+from hashlib import blake2b
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.ext.asyncio import AsyncSession
+from cachetools import TTLCache
+from fastapi import HTTPException, Request, status
 
 from app.core.security import decode_access_token
-from app.db.session import get_db as _get_db
+from app.db.session import get_db, get_db_readonly
 
-security_scheme = HTTPBearer()
+# ── Decoded-JWT cache ────────────────────────
+# Polling clients (dashboards, pipeline status pages) re-send the same bearer
+# token every few seconds; caching the decoded payload for a short TTL skips
+# the JSON parse + signature verification on repeat hits. Invalid tokens are
+# cached too (as a sentinel), so a bad token cannot force repeated crypto work.
+_TOKEN_CACHE_TTL = 5
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=_TOKEN_CACHE_TTL)
+_INVALID_TOKEN = object()
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Yield an async DB session."""
-    async for session in _get_db():
-        yield session
+def _decode_token_cached(token: str) -> dict | None:
+    """Decode a JWT, consulting the short-TTL cache first."""
+    # Key on a 16-byte blake2b digest rather than the raw token: a JWT is
+    # hundreds of bytes, and dict/TTLCache hash the full string on every
+    # lookup. One SIMD-accelerated digest call is cheaper and bounds the
+    # memory each cache entry pins.
+    key = blake2b(token.encode(), digest_size=16).digest()
+    cached = _TOKEN_CACHE.get(key)
+    if cached is not None:
+        return None if cached is _INVALID_TOKEN else cached
 
+    payload = decode_access_token(token)
+    if payload is None:
+        _TOKEN_CACHE[key] = _INVALID_TOKEN
+        return None
+
+    # Only cache tokens that stay valid for at least the full cache TTL, so a
+    # cached payload can never outlive its own `exp` claim.
+    if payload.get("exp", 0) - time.time() > _TOKEN_CACHE_TTL:
+        _TOKEN_CACHE[key] = payload
+    return payload
+
+
+# get_db / get_db_readonly are re-exported from app.db.session directly
+# (imported above). Wrapping them in pass-through async generators here
+# doubled the generator machinery per request and gave the two wrappers a
+# distinct identity from the canonical dependency, defeating FastAPI's
+# per-request dependency cache for any caller importing from app.db.session.
+
+
+def _extract_bearer_token(request: Request) -> str:
+    """Pull the bearer token straight off the Authorization header.
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
-) -> dict:
+    Cheaper than fastapi.security.HTTPBearer, which allocates a scheme
+    object and credentials model on every request.
+    """
+    authorization = request.headers.get("authorization")
+    if not authorization or not authorization[:7].lower() == "bearer ":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return authorization[7:]
+
+
+async def get_current_user(request: Request) -> dict:
     """Decode JWT and return the current user payload."""
-    payload = decode_access_token(credentials.credentials)
+    payload = _decode_token_cached(_extract_bearer_token(request))
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
         )
     return payload
+
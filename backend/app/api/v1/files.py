@@ -7,18 +7,18 @@ from uuid import UUID
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
+from app.api.deps import get_db_readonly
 
 router = APIRouter(prefix="/files", tags=["Files"])
 
 
 @router.get("/")
-async def list_files(db: AsyncSession = Depends(get_db)):
+async def list_files(db: AsyncSession = Depends(get_db_readonly)):
     """List all file ingestion records (filterable)."""
     return {"data": [], "message": "Not yet implemented"}
 
 
 @router.get("/{file_id}")
-async def get_file(file_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_file(file_id: UUID, db: AsyncSession = Depends(get_db_readonly)):
     """Get file detail with all extracted records."""
     return {"message": "Not yet implemented"}
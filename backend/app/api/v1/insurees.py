@@ -7,41 +7,41 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_db_readonly, get_current_user
 
 router = APIRouter(prefix="/insurees", tags=["Insurees"])
 
 
 @router.get("/")
-async def list_insurees(db: AsyncSession = Depends(get_db)):
+async def list_insurees(db: AsyncSession = Depends(get_db_readonly)):
     """List all insuree configurations."""
     # TODO: implement query
     return {"data": [], "message": "Not yet implemented"}
 
 
-@router.post("/", status_code=status.HTTP_201_CREATED)
-async def create_insuree(db: AsyncSession = Depends(get_db), user=Depends(get_current_user)):
+@router.post("/", status_code=status.HTTP_201_CREATED, dependencies=[Depends(get_current_user)])
+async def create_insuree(db: AsyncSession = Depends(get_db)):
     """Create a new insuree configuration."""
     # TODO: implement creation
     return {"message": "Not yet implemented"}
 
 
-@router.put("/{insuree_id}")
-async def update_insuree(insuree_id: UUID, db: AsyncSession = Depends(get_db), user=Depends(get_current_user)):
+@router.put("/{insuree_id}", dependencies=[Depends(get_current_user)])
+async def update_insuree(insuree_id: UUID, db: AsyncSession = Depends(get_db)):
     """Update an existing insuree configuration."""
     # TODO: implement update
     return {"message": "Not yet implemented"}
 
 
-@router.post("/{insuree_id}/test-sftp")
-async def test_sftp(insuree_id: UUID, db: AsyncSession = Depends(get_db), user=Depends(get_current_user)):
+@router.post("/{insuree_id}/test-sftp", dependencies=[Depends(get_current_user)])
+async def test_sftp(insuree_id: UUID, db: AsyncSession = Depends(get_db)):
     """Test SFTP connectivity for an insuree."""
     # TODO: implement SFTP test
     return {"message": "Not yet implemented"}
 
 
-@router.post("/{insuree_id}/trigger-poll")
-async def trigger_poll(insuree_id: UUID, db: AsyncSession = Depends(get_db), user=Depends(get_current_user)):
+@router.post("/{insuree_id}/trigger-poll", dependencies=[Depends(get_current_user)])
+async def trigger_poll(insuree_id: UUID, db: AsyncSession = Depends(get_db)):
     """Manually trigger SFTP poll for an insuree."""
     # TODO: dispatch celery task
     return {"message": "Not yet implemented"}
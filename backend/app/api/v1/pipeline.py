@@ -5,19 +5,29 @@ Pipeline management endpoints — trigger, list, and detail views.
 from uuid import UUID
 from datetime import datetime, timezone
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select, desc
+from fastapi.responses import Response
+from sqlalchemy import select, desc, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_db_readonly
 from app.db.models.pipeline_run import PipelineRun
-from app.db.models.pipeline_step_log import PipelineStepLog
-from app.db.models.pipeline_file import PipelineFile
-from app.db.models.pipeline_extracted_data import PipelineExtractedData
+from app.pipeline.insurers.abhi import ABHI_CONFIG
+from app.tasks.processing_tasks import process_file
 
 router = APIRouter(prefix="/pipeline", tags=["Pipeline"])
 
+# Hoisted out of trigger_pipeline so the hot path just builds the row —
+# no per-request import machinery or dict-get defaults.
+_ABHI_CODE = ABHI_CONFIG.get("code", "ABHI")
+_ABHI_NAME = ABHI_CONFIG.get("name", "Aditya Birla Health Insurance")
+_TEST_DIR = "/app/test_files"
+_ABHI_FILES = (
+    {"file_id": "abhi-f1", "filename": "Annexure.xls", "role": "endorsement_data", "s3_key": f"{_TEST_DIR}/Annexure.xls"},
+    {"file_id": "abhi-f2", "filename": "Schedule.pdf", "role": "endorsement_pdf", "s3_key": f"{_TEST_DIR}/Schedule.pdf"},
+)
+
 
 # ─── Trigger ──────────────────────────────────────────────
 @router.post("/trigger")
@@ -29,15 +39,10 @@ async def trigger_pipeline(db: AsyncSession = Depends(get_db)):
     2. Dispatches a Celery task (worker updates to RUNNING → COMPLETED/FAILED)
     3. Returns instantly with the run_id
     """
-    from app.tasks.processing_tasks import process_file
-    from app.pipeline.insurers.abhi import ABHI_CONFIG
-
-    test_dir = "/app/test_files"
-
     # ── Step 1: Create PENDING run in DB ──────────────────
     run = PipelineRun(
-        insurer_code=ABHI_CONFIG.get("code", "ABHI"),
-        insurer_name=ABHI_CONFIG.get("name", "Aditya Birla Health Insurance"),
+        insurer_code=_ABHI_CODE,
+        insurer_name=_ABHI_NAME,
         status="PENDING",
         started_at=datetime.now(timezone.utc),
     )
@@ -50,13 +55,13 @@ async def trigger_pipeline(db: AsyncSession = Depends(get_db)):
         file_ingestion_id=run_id,   # use the DB run_id as execution_id
         insuree_id="abhi-insuree-001",
         insuree_config=ABHI_CONFIG,
-        files=[
-            {"file_id": "abhi-f1", "filename": "Annexure.xls", "role": "endorsement_data", "s3_key": f"{test_dir}/Annexure.xls"},
-            {"file_id": "abhi-f2", "filename": "Schedule.pdf", "role": "endorsement_pdf", "s3_key": f"{test_dir}/Schedule.pdf"},
-        ],
+        files=[dict(f) for f in _ABHI_FILES],
     )
 
-    # Commit happens automatically via get_db dependency
+    # get_db no longer auto-commits; make the PENDING row durable before
+    # the client can poll for it.
+    await db.commit()
+
     return {
         "message": "Pipeline queued",
         "run_id": run_id,
@@ -72,116 +77,134 @@ async def list_pipeline_runs(
     status: str | None = None,
     limit: int = 50,
     offset: int = 0,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_readonly),
 ):
     """List pipeline runs with optional filters."""
-    query = select(PipelineRun).order_by(desc(PipelineRun.started_at))
-
+    filters = []
     if insurer_code:
-        query = query.where(PipelineRun.insurer_code == insurer_code)
+        filters.append(PipelineRun.insurer_code == insurer_code)
     if status:
-        query = query.where(PipelineRun.status == status)
+        filters.append(PipelineRun.status == status)
+
+    # Column-level select: rows come back as plain mappings, skipping ORM
+    # instantiation and per-attribute access on the hot list path.
+    query = (
+        select(
+            PipelineRun.id,
+            PipelineRun.insurer_code,
+            PipelineRun.insurer_name,
+            PipelineRun.status,
+            PipelineRun.total_steps,
+            PipelineRun.steps_completed,
+            PipelineRun.started_at,
+            PipelineRun.completed_at,
+            PipelineRun.duration_ms,
+            PipelineRun.error_message,
+            PipelineRun.created_at,
+        )
+        .where(*filters)
+        .order_by(desc(PipelineRun.started_at))
+        .limit(limit)
+        .offset(offset)
+    )
+    count_query = select(func.count()).select_from(PipelineRun).where(*filters)
 
-    query = query.limit(limit).offset(offset)
-    result = await db.execute(query)
-    runs = result.scalars().all()
+    total = (await db.execute(count_query)).scalar_one()
 
-    return {
-        "data": [
-            {
-                "id": str(r.id),
-                "insurer_code": r.insurer_code,
-                "insurer_name": r.insurer_name,
-                "status": r.status,
-                "total_steps": r.total_steps,
-                "steps_completed": r.steps_completed,
-                "started_at": r.started_at.isoformat() if r.started_at else None,
-                "completed_at": r.completed_at.isoformat() if r.completed_at else None,
-                "duration_ms": r.duration_ms,
-                "error_message": r.error_message,
-                "created_at": r.created_at.isoformat() if r.created_at else None,
-            }
-            for r in runs
-        ],
-        "total": len(runs),
-    }
+    # Fetch and encode inside the handler: yield-dependency teardown runs
+    # before the response body iterates on this FastAPI version, so a
+    # streaming generator would see a closed session — and the readonly
+    # engine is AUTOCOMMIT, where asyncpg refuses the server-side cursor
+    # db.stream() needs anyway. With limit defaulting to 50 the payload is
+    # small; one orjson.dumps of the buffered rows (UUIDs and datetimes
+    # encode natively) is the cheap and correct shape here.
+    rows = (await db.execute(query)).mappings().all()
+    payload = orjson.dumps({"data": [dict(row) for row in rows], "total": total})
+    return Response(content=payload, media_type="application/json")
 
 
 # ─── Run Detail ───────────────────────────────────────────
+# Single round trip: Postgres joins, orders, and serializes the whole detail
+# payload as jsonb in C, replacing four selectinload SELECTs plus three
+# Python re-serialization loops. Timestamps render as ISO 8601 via to_jsonb.
+_RUN_DETAIL_QUERY = text(
+    """
+    SELECT jsonb_build_object(
+        'id', pr.id::text,
+        'insurer_code', pr.insurer_code,
+        'insurer_name', pr.insurer_name,
+        'status', pr.status,
+        'total_steps', pr.total_steps,
+        'steps_completed', pr.steps_completed,
+        'started_at', pr.started_at,
+        'completed_at', pr.completed_at,
+        'duration_ms', pr.duration_ms,
+        'error_message', pr.error_message,
+        'config_snapshot', pr.config_snapshot,
+        'context_summary', pr.context_summary,
+        'created_at', pr.created_at,
+        'updated_at', pr.updated_at,
+        'steps', COALESCE(
+            (SELECT jsonb_agg(jsonb_build_object(
+                'id', sl.id::text,
+                'step_index', sl.step_index,
+                'step_name', sl.step_name,
+                'step_description', sl.step_description,
+                'status', sl.status,
+                'started_at', sl.started_at,
+                'completed_at', sl.completed_at,
+                'duration_ms', sl.duration_ms,
+                'error_message', sl.error_message,
+                'metadata', sl.metadata,
+                'retry_count', sl.retry_count
+            ) ORDER BY sl.step_index)
+            FROM pipeline_step_logs sl WHERE sl.run_id = pr.id),
+            '[]'::jsonb
+        ),
+        'files', COALESCE(
+            (SELECT jsonb_agg(jsonb_build_object(
+                'id', pf.id::text,
+                'file_id', pf.file_id,
+                'filename', pf.filename,
+                'role', pf.role,
+                'detected_format', pf.detected_format,
+                'record_count', pf.record_count,
+                'status', pf.status,
+                'error_message', pf.error_message
+            ) ORDER BY pf.created_at)
+            FROM pipeline_files pf WHERE pf.run_id = pr.id),
+            '[]'::jsonb
+        ),
+        'extracted_data', COALESCE(
+            (SELECT jsonb_agg(jsonb_build_object(
+                'id', ed.id::text,
+                'source_role', ed.source_role,
+                'extraction_method', ed.extraction_method,
+                'llm_model', ed.llm_model,
+                'raw_data', ed.raw_data,
+                'data', ed.data,
+                'created_at', ed.created_at
+            ) ORDER BY ed.created_at)
+            FROM pipeline_extracted_data ed WHERE ed.run_id = pr.id),
+            '[]'::jsonb
+        )
+    )::text
+    FROM pipeline_runs pr
+    WHERE pr.id = :run_id
+    """
+)
+
+
 @router.get("/runs/{run_id}")
-async def get_pipeline_run(run_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_pipeline_run(run_id: UUID, db: AsyncSession = Depends(get_db_readonly)):
     """Get full detail: run + steps + files + extracted data."""
-    result = await db.execute(
-        select(PipelineRun)
-        .where(PipelineRun.id == run_id)
-        .options(
-            selectinload(PipelineRun.step_logs),
-            selectinload(PipelineRun.files).selectinload(PipelineFile.extracted_data),
-            selectinload(PipelineRun.extracted_data),
-        )
-    )
-    run = result.scalar_one_or_none()
+    result = await db.execute(_RUN_DETAIL_QUERY, {"run_id": run_id})
+    detail = result.scalar_one_or_none()
 
-    if not run:
+    if detail is None:
         raise HTTPException(status_code=404, detail="Pipeline run not found")
 
-    return {
-        "id": str(run.id),
-        "insurer_code": run.insurer_code,
-        "insurer_name": run.insurer_name,
-        "status": run.status,
-        "total_steps": run.total_steps,
-        "steps_completed": run.steps_completed,
-        "started_at": run.started_at.isoformat() if run.started_at else None,
-        "completed_at": run.completed_at.isoformat() if run.completed_at else None,
-        "duration_ms": run.duration_ms,
-        "error_message": run.error_message,
-        "config_snapshot": run.config_snapshot,
-        "context_summary": run.context_summary,
-        "created_at": run.created_at.isoformat() if run.created_at else None,
-        "updated_at": run.updated_at.isoformat() if run.updated_at else None,
-        # ── Steps ──
-        "steps": [
-            {
-                "id": str(s.id),
-                "step_index": s.step_index,
-                "step_name": s.step_name,
-                "step_description": s.step_description,
-                "status": s.status,
-                "started_at": s.started_at.isoformat() if s.started_at else None,
-                "completed_at": s.completed_at.isoformat() if s.completed_at else None,
-                "duration_ms": s.duration_ms,
-                "error_message": s.error_message,
-                "metadata": s.metadata_,
-                "retry_count": s.retry_count,
-            }
-            for s in sorted(run.step_logs, key=lambda x: x.step_index)
-        ],
-        # ── Files ──
-        "files": [
-            {
-                "id": str(f.id),
-                "file_id": f.file_id,
-                "filename": f.filename,
-                "role": f.role,
-                "detected_format": f.detected_format,
-                "record_count": f.record_count,
-                "status": f.status,
-                "error_message": f.error_message,
-            }
-            for f in run.files
-        ],
-        # ── Extracted Data ──
-        "extracted_data": [
-            {
-                "id": str(ed.id),
-                "source_role": ed.source_role,
-                "extraction_method": ed.extraction_method,
-                "llm_model": ed.llm_model,
-                "raw_data": ed.raw_data,
-                "data": ed.data,
-                "created_at": ed.created_at.isoformat() if ed.created_at else None,
-            }
-            for ed in run.extracted_data
-        ],
-    }
+    # The ::text cast hands us ready-to-send JSON: no jsonb deserialization
+    # into Python objects and no re-encode on the event loop for the largest
+    # payload in the API.
+    return Response(content=detail, media_type="application/json")
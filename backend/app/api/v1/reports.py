@@ -5,24 +5,24 @@ Analytics & reporting endpoints.
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
+from app.api.deps import get_db_readonly
 
 router = APIRouter(prefix="/reports", tags=["Reports"])
 
 
 @router.get("/volume")
-async def get_volume_report(db: AsyncSession = Depends(get_db)):
+async def get_volume_report(db: AsyncSession = Depends(get_db_readonly)):
     """Volume by insuree and date range."""
     return {"data": [], "message": "Not yet implemented"}
 
 
 @router.get("/sla")
-async def get_sla_report(db: AsyncSession = Depends(get_db)):
+async def get_sla_report(db: AsyncSession = Depends(get_db_readonly)):
     """SLA compliance metrics."""
     return {"data": [], "message": "Not yet implemented"}
 
 
 @router.get("/errors")
-async def get_error_report(db: AsyncSession = Depends(get_db)):
+async def get_error_report(db: AsyncSession = Depends(get_db_readonly)):
     """Error rate by insuree."""
     return {"data": [], "message": "Not yet implemented"}
@@ -5,12 +5,12 @@ Human review queue endpoints.
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db_readonly
 
 router = APIRouter(prefix="/review", tags=["Review"])
 
 
 @router.get("/")
-async def list_review_queue(db: AsyncSession = Depends(get_db)):
+async def list_review_queue(db: AsyncSession = Depends(get_db_readonly)):
     """List endorsements pending human review."""
     return {"data": [], "message": "Not yet implemented"}
@@ -2,6 +2,8 @@
 Pydantic Settings — centralized configuration loaded from environment variables.
 """
 
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -14,16 +16,27 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int = 5432
     POSTGRES_DB: str = "endorsements_db"
 
-    @property
+    # Settings are immutable after load, so both URLs are built once on
+    # first access instead of re-running the f-string + five attribute
+    # lookups every time.
+    @cached_property
     def DATABASE_URL(self) -> str:
         """Async URL for app runtime (asyncpg)."""
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
-    @property
+    @cached_property
     def DATABASE_URL_SYNC(self) -> str:
         """Sync URL for Alembic migrations (psycopg2)."""
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    # ── Database pool ─────────────────────────
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
+    DB_ECHO: bool = False
+    DB_SLOW_QUERY_MS: int = 50
+
     # ── Redis / Celery ────────────────────────
     REDIS_URL: str = "redis://localhost:6379/0"
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"
@@ -69,6 +82,14 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 480
 
+    # ── CORS ──────────────────────────────────
+    # Explicit origin list (wildcard + credentials forces the middleware to
+    # echo the Origin on every cross-origin hit). Override in production.
+    CORS_ALLOWED_ORIGINS: list[str] = [
+        "http://localhost",
+        "http://localhost:5173",
+    ]
+
     # ── Application ───────────────────────────
     APP_ENV: str = "development"
     MIN_CONFIDENCE_THRESHOLD: float = 0.80
@@ -81,4 +102,15 @@ class Settings(BaseSettings):
     model_config = {"env_file": ["../.env", ".env"], "extra": "ignore"}
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance.
+
+    Cached so env parsing runs once; tests can override via
+    ``get_settings.cache_clear()`` or FastAPI dependency overrides.
+    """
+    return Settings()
+
+
+# Back-compat module-level instance — same object get_settings() returns.
+settings = get_settings()
@@ -5,7 +5,9 @@ All status values, format types, endorsement types, and step names
 are defined here and imported throughout the application.
 """
 
+import sys
 from enum import StrEnum
+from typing import Final
 
 
 # ═══════════════════════════════════════════════════════════
@@ -31,6 +33,18 @@ class StepStatus(StrEnum):
     RETRYING = "RETRYING"
 
 
+# Interned plain-string aliases for the statuses the pipeline engine
+# compares in its step loop. Enum members inherit from str, but comparing
+# against an enum member still dispatches through Enum __eq__; these
+# interned constants compare as raw strings (pointer-equal on hits).
+PIPELINE_RUNNING: Final[str] = sys.intern(PipelineStatus.RUNNING.value)
+PIPELINE_COMPLETED: Final[str] = sys.intern(PipelineStatus.COMPLETED.value)
+PIPELINE_FAILED: Final[str] = sys.intern(PipelineStatus.FAILED.value)
+STEP_COMPLETED: Final[str] = sys.intern(StepStatus.COMPLETED.value)
+STEP_FAILED: Final[str] = sys.intern(StepStatus.FAILED.value)
+STEP_SKIPPED: Final[str] = sys.intern(StepStatus.SKIPPED.value)
+
+
 # ═══════════════════════════════════════════════════════════
 #  File Processing
 # ═══════════════════════════════════════════════════════════
@@ -1,15 +1,36 @@
 """
 Structured JSON logging setup using structlog.
+
+Emission is decoupled from the caller: records go onto an in-process
+queue and a background QueueListener thread does the actual stream
+write, so a slow stdout (piped, redirected, containerized) never blocks
+the asyncio event loop or Celery workers.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 import structlog
 
+_configured = False
+_listener: QueueListener | None = None
+
 
 def setup_logging(log_level: str = "INFO") -> None:
-    """Configure structured logging for the application."""
+    """Configure structured logging for the application.
+
+    Idempotent: safe to call from module import and again from lifespan
+    hooks without reconfiguring processors.
+    """
+    global _configured, _listener
+    if _configured:
+        return
+    _configured = True
+
+    level = getattr(logging, log_level.upper(), logging.INFO)
 
     structlog.configure(
         processors=[
@@ -20,20 +41,25 @@ def setup_logging(log_level: str = "INFO") -> None:
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.JSONRenderer(),
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, log_level.upper(), logging.INFO)
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
-    # Also configure stdlib logging to avoid noisy warnings
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, log_level.upper(), logging.INFO),
-    )
+    # Callers enqueue; the listener thread owns the blocking stream write.
+    log_queue: queue.Queue = queue.Queue(maxsize=10_000)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.handlers.clear()
+    root.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
 
 
 def get_logger(name: str = __name__) -> structlog.BoundLogger:
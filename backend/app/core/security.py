@@ -5,7 +5,7 @@ JWT authentication & password hashing utilities.
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
@@ -13,6 +13,12 @@ from app.core.config import settings
 # ── Password Hashing ─────────────────────────
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Key material prepared once at import: jose otherwise re-runs
+# jwk.construct (key parsing + HMAC key scheduling) on every encode and
+# decode call. The algorithm list is hoisted for the same reason.
+_SIGNING_KEY = jwk.construct(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+_ALGORITHMS = [settings.JWT_ALGORITHM]
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -29,13 +35,13 @@ def create_access_token(data: dict[str, Any], expires_delta: timedelta | None =
         expires_delta or timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    return jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
 def decode_access_token(token: str) -> dict[str, Any] | None:
     """Decode JWT token. Returns payload dict or None if invalid."""
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=_ALGORITHMS)
         return payload
     except JWTError:
         return None
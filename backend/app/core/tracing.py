@@ -91,9 +91,24 @@ def traceable_step(
             ...
     """
     def decorator(func: Callable) -> Callable:
+        # Decoration-time bypass: whether tracing can ever be on is fixed by
+        # settings (the same condition setup_tracing checks). In the common
+        # untraced case the step keeps its original function — no extra
+        # coroutine frame, no per-call branch.
+        if not settings.LANGSMITH_TRACING or not settings.LANGSMITH_API_KEY:
+            return func
+
+        # Built once on the first traced call, not per invocation: rebuilding
+        # traceable(...)(func) each time paid an import lookup, dict/closure
+        # allocation, and wrapper construction on every hot pipeline step.
+        traced_fn: Callable | None = None
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            if _tracing_enabled:
+            nonlocal traced_fn
+            if not _tracing_enabled:
+                return await func(*args, **kwargs)
+            if traced_fn is None:
                 try:
                     from langsmith import traceable
 
@@ -103,15 +118,13 @@ def traceable_step(
                         metadata=metadata or {},
                         tags=tags or [],
                     )(func)
-                    return await traced_fn(*args, **kwargs)
                 except ImportError:
                     logger.warning("langsmith not installed, skipping tracing")
-                    return await func(*args, **kwargs)
+                    traced_fn = func
                 except Exception as exc:
                     # Tracing failure should never break the pipeline
                     logger.warning("LangSmith tracing failed, continuing without", error=str(exc))
-                    return await func(*args, **kwargs)
-            else:
-                return await func(*args, **kwargs)
+                    traced_fn = func
+            return await traced_fn(*args, **kwargs)
         return wrapper
     return decorator
@@ -0,0 +1,46 @@
+"""add_dashboard_indexes
+
+Revision ID: 9f41c6b2ad57
+Revises: 53b824318ebe
+Create Date: 2026-08-30 10:42:11.503281
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9f41c6b2ad57'
+down_revision: Union[str, None] = '53b824318ebe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_runs_insurer_status_started',
+        'pipeline_runs',
+        ['insurer_code', 'status', 'started_at'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_runs_failed_started',
+        'pipeline_runs',
+        ['started_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'FAILED'"),
+    )
+    op.create_index(
+        'ix_step_logs_run_index',
+        'pipeline_step_logs',
+        ['run_id', 'step_index'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_step_logs_run_index', table_name='pipeline_step_logs')
+    op.drop_index('ix_runs_failed_started', table_name='pipeline_runs')
+    op.drop_index('ix_runs_insurer_status_started', table_name='pipeline_runs')
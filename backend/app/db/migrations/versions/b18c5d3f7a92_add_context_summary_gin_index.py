@@ -0,0 +1,31 @@
+"""add_context_summary_gin_index
+
+Revision ID: b18c5d3f7a92
+Revises: e7a2f4c91b06
+Create Date: 2026-08-30 12:03:51.664128
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b18c5d3f7a92'
+down_revision: Union[str, None] = 'e7a2f4c91b06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_runs_ctx_gin',
+        'pipeline_runs',
+        ['context_summary'],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_runs_ctx_gin', table_name='pipeline_runs')
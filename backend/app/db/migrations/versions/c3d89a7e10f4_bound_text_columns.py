@@ -0,0 +1,48 @@
+"""bound_text_columns
+
+Revision ID: c3d89a7e10f4
+Revises: 9f41c6b2ad57
+Create Date: 2026-08-30 11:05:44.918262
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d89a7e10f4'
+down_revision: Union[str, None] = '9f41c6b2ad57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'pipeline_runs', 'error_message',
+        type_=sa.String(2000), existing_type=sa.Text(),
+        postgresql_using='left(error_message, 2000)',
+    )
+    op.alter_column(
+        'pipeline_step_logs', 'error_message',
+        type_=sa.String(2000), existing_type=sa.Text(),
+        postgresql_using='left(error_message, 2000)',
+    )
+    op.alter_column(
+        'pipeline_files', 'error_message',
+        type_=sa.String(2000), existing_type=sa.Text(),
+        postgresql_using='left(error_message, 2000)',
+    )
+    op.alter_column(
+        'users', 'hashed_password',
+        type_=sa.String(255), existing_type=sa.Text(),
+        postgresql_using='left(hashed_password, 255)',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column('users', 'hashed_password', type_=sa.Text(), existing_type=sa.String(255))
+    op.alter_column('pipeline_files', 'error_message', type_=sa.Text(), existing_type=sa.String(2000))
+    op.alter_column('pipeline_step_logs', 'error_message', type_=sa.Text(), existing_type=sa.String(2000))
+    op.alter_column('pipeline_runs', 'error_message', type_=sa.Text(), existing_type=sa.String(2000))
@@ -0,0 +1,41 @@
+"""server_side_timestamp_defaults
+
+Revision ID: e7a2f4c91b06
+Revises: c3d89a7e10f4
+Create Date: 2026-08-30 11:42:18.307415
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a2f4c91b06'
+down_revision: Union[str, None] = 'c3d89a7e10f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_NOW = sa.text('now()')
+
+_COLUMNS = (
+    ('pipeline_runs', 'started_at'),
+    ('pipeline_runs', 'created_at'),
+    ('pipeline_runs', 'updated_at'),
+    ('pipeline_files', 'created_at'),
+    ('pipeline_extracted_data', 'created_at'),
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+)
+
+
+def upgrade() -> None:
+    # Defaults only — existing data is untouched.
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=_NOW)
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=None)
@@ -7,6 +7,8 @@ Convention:
     - The `__init__.py` re-exports all models so Alembic sees them
 """
 
+import os
+import time
 import uuid
 from datetime import datetime, timezone
 
@@ -22,8 +24,23 @@ class Base(DeclarativeBase):
 
 # ─── Shared helpers ───────────────────────────
 def generate_uuid() -> uuid.UUID:
-    """Generate a new UUID v4."""
-    return uuid.uuid4()
+    """Generate a time-ordered UUID v7.
+
+    Random v4 keys fragment the primary-key B-tree on insert; a 48-bit
+    millisecond timestamp prefix keeps inserts append-only, which matters
+    most for pipeline_step_logs (the highest-cardinality write table).
+    Layout per RFC 9562: unix_ts_ms(48) | ver(4) | rand_a(12) | var(2) | rand_b(62).
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")  # 80 random bits
+    value = (
+        (ts_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand >> 68) << 64          # rand_a: top 12 bits
+        | 0x2 << 62                   # RFC 4122 variant
+        | (rand & 0x3FFF_FFFF_FFFF_FFFF)  # rand_b: low 62 bits
+    )
+    return uuid.UUID(int=value)
 
 
 def utcnow() -> datetime:
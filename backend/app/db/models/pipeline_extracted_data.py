@@ -8,11 +8,11 @@ Linked to PipelineRun and PipelineFile via FKs.
 
 from __future__ import annotations
 
-from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy import Column, DateTime, ForeignKey, String, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
-from app.db.models.base import Base, generate_uuid, utcnow
+from app.db.models.base import Base, generate_uuid
 
 
 class PipelineExtractedData(Base):
@@ -34,7 +34,7 @@ class PipelineExtractedData(Base):
     data = Column(JSONB, default=dict)      # Parsed / processed / mapped data
 
     # ── Timestamps ────────────────────────────
-    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # ── Relationships ─────────────────────────
     run = relationship("PipelineRun", back_populates="extracted_data")
@@ -7,11 +7,11 @@ Linked to PipelineRun via run_id FK.
 
 from __future__ import annotations
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from app.db.models.base import Base, generate_uuid, utcnow
+from app.db.models.base import Base, generate_uuid
 
 
 class PipelineFile(Base):
@@ -35,10 +35,10 @@ class PipelineFile(Base):
 
     # ── Status ────────────────────────────────
     status = Column(String(50), nullable=False, default="PENDING")
-    error_message = Column(Text, nullable=True)
+    error_message = Column(String(2000), nullable=True)
 
     # ── Timestamps ────────────────────────────
-    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # ── Relationships ─────────────────────────
     run = relationship("PipelineRun", back_populates="files")
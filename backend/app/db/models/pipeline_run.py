@@ -8,7 +8,7 @@ for filtering by insurer, status, and date range.
 
 from __future__ import annotations
 
-from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy import Column, DateTime, Index, Integer, String, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
@@ -19,6 +19,20 @@ class PipelineRun(Base):
     """One row per pipeline execution."""
 
     __tablename__ = "pipeline_runs"
+    __table_args__ = (
+        # Dashboard queries filter by insurer + status and sort by recency;
+        # one composite B-tree seek instead of bitmap-ANDing three indexes.
+        Index("ix_runs_insurer_status_started", "insurer_code", "status", "started_at"),
+        # Error dashboards only look at failures — a partial index stays tiny.
+        Index(
+            "ix_runs_failed_started",
+            "started_at",
+            postgresql_where=text("status = 'FAILED'"),
+        ),
+        # Dashboard filters on context_summary keys (@>, ?) seek through
+        # GIN instead of scanning every row's JSONB.
+        Index("ix_runs_ctx_gin", "context_summary", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=generate_uuid)
 
@@ -32,12 +46,14 @@ class PipelineRun(Base):
     steps_completed = Column(Integer, default=0)
 
     # ── Timing (UTC) ─────────────────────────
-    started_at = Column(DateTime(timezone=True), default=utcnow, index=True)
+    started_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     duration_ms = Column(Integer, nullable=True)
 
     # ── Error ─────────────────────────────────
-    error_message = Column(Text, nullable=True)
+    # Bounded so the tuple stays inline instead of TOASTing (dashboards
+    # scan this column on every runs page).
+    error_message = Column(String(2000), nullable=True)
 
     # ── Config snapshot ───────────────────────
     config_snapshot = Column(JSONB, default=dict)
@@ -48,13 +64,15 @@ class PipelineRun(Base):
     context_summary = Column(JSONB, default=dict)
 
     # ── Audit timestamps ─────────────────────
-    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
-    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow, nullable=False)
+    # Filled by Postgres at INSERT time — no Python datetime allocation or
+    # bind param per row. updated_at keeps the client-side onupdate.
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=utcnow, nullable=False)
 
     # ── Relationships ─────────────────────────
     step_logs = relationship("PipelineStepLog", back_populates="run", cascade="all, delete-orphan", order_by="PipelineStepLog.step_index")
-    files = relationship("PipelineFile", back_populates="run", cascade="all, delete-orphan")
-    extracted_data = relationship("PipelineExtractedData", back_populates="run", cascade="all, delete-orphan")
+    files = relationship("PipelineFile", back_populates="run", cascade="all, delete-orphan", order_by="PipelineFile.created_at")
+    extracted_data = relationship("PipelineExtractedData", back_populates="run", cascade="all, delete-orphan", order_by="PipelineExtractedData.created_at")
 
     def __repr__(self) -> str:
         return f"<PipelineRun {self.id} insurer={self.insurer_code} status={self.status} steps={self.steps_completed}/{self.total_steps}>"
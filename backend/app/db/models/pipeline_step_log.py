@@ -7,7 +7,7 @@ Linked to PipelineRun via run_id FK.
 
 from __future__ import annotations
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
@@ -18,6 +18,12 @@ class PipelineStepLog(Base):
     """One row per step execution within a pipeline run."""
 
     __tablename__ = "pipeline_step_logs"
+    __table_args__ = (
+        # The run detail endpoint and the relationship's
+        # order_by="PipelineStepLog.step_index" become a single index range
+        # scan per run instead of a fetch + sort.
+        Index("ix_step_logs_run_index", "run_id", "step_index"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=generate_uuid)
     run_id = Column(UUID(as_uuid=True), ForeignKey("pipeline_runs.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -36,7 +42,7 @@ class PipelineStepLog(Base):
     duration_ms = Column(Integer, nullable=True)
 
     # ── Error ─────────────────────────────────
-    error_message = Column(Text, nullable=True)
+    error_message = Column(String(2000), nullable=True)
 
     # ── Step output / metadata ────────────────
     metadata_ = Column("metadata", JSONB, default=dict)
@@ -10,7 +10,7 @@ Roles:
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.models.base import Base, utcnow
@@ -25,7 +25,8 @@ class User(Base):
     email: Mapped[str] = mapped_column(
         String(320), unique=True, nullable=False, index=True
     )
-    hashed_password: Mapped[str] = mapped_column(Text, nullable=False)
+    # bcrypt output is 60 chars; bounded to keep the row inline
+    hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[str] = mapped_column(
         String(20), nullable=False, default="VIEWER"
@@ -35,10 +36,10 @@ class User(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utcnow, onupdate=utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), onupdate=utcnow, nullable=False
     )
     last_login_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
@@ -2,32 +2,102 @@
 Async SQLAlchemy session factory.
 """
 
+import time
+
+import orjson
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
 from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger("db")
 
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=(settings.APP_ENV == "development"),
-    pool_size=20,
-    max_overflow=10,
-    pool_pre_ping=True,
+    # echo=True wrote every statement to stderr synchronously on the event
+    # loop; full SQL logging is now an explicit opt-in via DB_ECHO, with a
+    # slow-query listener (below) covering the common case.
+    echo=settings.DB_ECHO,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    # Bound how long a burst waits for a slot instead of hanging on the
+    # default QueuePool behavior.
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    # Pre-ping adds a round trip per checkout on the hot path; recycling
+    # connections periodically catches stale ones instead.
+    pool_pre_ping=False,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # JSONB columns (config snapshots, context summaries, extracted data)
+    # round-trip through orjson's C encoder instead of stdlib json.
+    json_serializer=lambda v: orjson.dumps(v).decode(),
+    json_deserializer=orjson.loads,
+    connect_args={
+        "server_settings": {"jit": "off"},
+        # The dashboard endpoints replay the same parameterized SELECTs on
+        # every poll; a larger prepared-statement cache lets Postgres skip
+        # parse/plan on repeat executions. Both caches are per-connection.
+        # (Drop to 0 if the pool is ever put behind PgBouncer in
+        # transaction mode — prepared statements don't survive it.)
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 1024,
+    },
 )
 
+# ── Slow-query logging ────────────────────────
+# Log only statements above the threshold instead of echoing everything.
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _query_start(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _query_end(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info["query_start"].pop()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if elapsed_ms >= settings.DB_SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query",
+            duration_ms=round(elapsed_ms, 1),
+            statement=statement[:500],
+        )
+
+
 async_session = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
+    # No implicit flush before every SELECT; the repositories flush
+    # explicitly where a generated PK or constraint check is needed.
+    autoflush=False,
+)
+
+# Read-only sessions: autocommit isolation means no implicit BEGIN/COMMIT
+# round trips, and autoflush is pointless when nothing is written.
+async_session_readonly = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
 )
 
 
 async def get_db() -> AsyncSession:
-    """Dependency that yields an async DB session."""
+    """Dependency that yields an async DB session.
+
+    Handlers that write must commit explicitly — committing here forced a
+    COMMIT round trip on every request, including pure reads, and held the
+    pool slot for the extra round trip under burst load.
+    """
     async with async_session() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
+
+
+async def get_db_readonly() -> AsyncSession:
+    """Dependency that yields an autocommit session for read-only endpoints."""
+    async with async_session_readonly() as session:
+        yield session
@@ -2,16 +2,45 @@
 File fingerprinting — MD5/SHA hash for deduplication.
 """
 
+import asyncio
 import hashlib
 
+try:
+    import blake3  # optional: SIMD-accelerated, several times faster than MD5/SHA
+except ImportError:
+    blake3 = None
+
+# 1 MiB per read: at the old 8 KiB that was ~128 Python↔C transitions per MiB
+# of file; the hash itself is C either way, so iteration count is the lever.
+_CHUNK_SIZE = 1 << 20
+
 
 def compute_file_hash(filepath: str, algorithm: str = "md5") -> str:
-    """Compute hash of a local file for deduplication."""
-    h = hashlib.new(algorithm)
+    """Compute hash of a local file for deduplication.
+
+    Runs the read/update loop in C via ``hashlib.file_digest`` (GIL released),
+    instead of chunking through Python. Pass ``algorithm="blake3"`` to use the
+    optional ``blake3`` package when it is installed.
+    """
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        if algorithm == "blake3" and blake3 is not None:
+            h = blake3.blake3()
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                h.update(chunk)
+            return h.hexdigest()
+        return hashlib.file_digest(f, algorithm).hexdigest()
+
+
+async def compute_file_hash_async(filepath: str, algorithm: str = "md5") -> str:
+    """Hash a file without blocking the event loop.
+
+    Async callers (FastAPI endpoints, the SFTP poller) must use this
+    rather than calling :func:`compute_file_hash` directly — the sync
+    read loop would otherwise hold the ASGI event loop for the whole
+    file. ``file_digest`` releases the GIL, so the worker thread hashes
+    in parallel with request handling.
+    """
+    return await asyncio.to_thread(compute_file_hash, filepath, algorithm)
 
 
 def is_already_processed(file_hash: str) -> bool:
@@ -2,25 +2,57 @@
 FastAPI application entry point.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 
 from app.core.config import settings
 from app.core.logging import setup_logging, get_logger
+
+# Configure logging at import so every worker process has structured
+# output before the first lifespan hook (and router imports log sanely).
+setup_logging("DEBUG" if settings.APP_ENV == "development" else "INFO")
+
 from app.core.tracing import setup_tracing
+from app.db.session import engine
 from app.api.v1 import insurees, files, endorsements, submissions, review, reports, pipeline
 
+# uvloop's C event loop is 2-4x faster on socket I/O and timers than stock
+# asyncio. uvicorn[standard] ships it and picks it up with --loop auto in
+# deployment; installing here covers `uvicorn app.main:app` and local dev.
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:  # pragma: no cover - uvloop unavailable on some platforms
+    pass
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup / shutdown events."""
-    setup_logging("DEBUG" if settings.APP_ENV == "development" else "INFO")
     setup_tracing()
     logger = get_logger("startup")
+
+    # Prewarm a few pooled connections so the first user requests don't
+    # pay the TCP + TLS + auth handshake.
+    async def _warm() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.gather(*(_warm() for _ in range(4)))
+    except Exception as exc:  # DB may be down in local tooling contexts
+        logger.warning("DB pool prewarm failed", error=str(exc))
+
     logger.info("Application starting", env=settings.APP_ENV)
     yield
+    await engine.dispose()
     logger.info("Application shutting down")
 
 
@@ -29,26 +61,59 @@ app = FastAPI(
     description="End-to-end insurance endorsement processing platform",
     version="0.1.0",
     lifespan=lifespan,
+    # orjson serializes datetime/UUID/dataclasses natively in C — the
+    # pipeline detail and list payloads are the hottest serialization paths.
+    default_response_class=ORJSONResponse,
 )
 
+# ─── Health short-circuit ─────────────────────
+# Liveness/readiness probes are the most frequent requests the app sees.
+# Answering them at the ASGI layer skips routing, dependency resolution,
+# and the rest of the middleware stack entirely. CORS preflights are
+# already short-circuited by CORSMiddleware before any route dependency
+# (including auth) runs.
+_HEALTH_PATHS = {"/health", "/healthz", "/readyz"}
+_HEALTH_BODY = orjson.dumps({"status": "ok", "env": settings.APP_ENV})
+_HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_BODY)).encode()),
+]
+
+
+class HealthShortCircuitMiddleware:
+    """Answer health probes before the rest of the ASGI stack."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in _HEALTH_PATHS and scope["method"] == "GET":
+            await send({"type": "http.response.start", "status": 200, "headers": _HEALTH_HEADERS})
+            await send({"type": "http.response.body", "body": _HEALTH_BODY})
+            return
+        await self.app(scope, receive, send)
+
+
 # ─── CORS ─────────────────────────────────────
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Restrict in production
+    allow_origins=settings.CORS_ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+    # Let browsers cache the preflight verdict for a day instead of
+    # re-issuing OPTIONS before every mutating request.
+    max_age=86400,
 )
 
+# Added after CORS so it runs first (Starlette middleware is outermost-last).
+app.add_middleware(HealthShortCircuitMiddleware)
+
 # ─── Routes ───────────────────────────────────
 API_PREFIX = "/api/v1"
-app.include_router(insurees.router, prefix=API_PREFIX)
-app.include_router(files.router, prefix=API_PREFIX)
-app.include_router(endorsements.router, prefix=API_PREFIX)
-app.include_router(submissions.router, prefix=API_PREFIX)
-app.include_router(review.router, prefix=API_PREFIX)
-app.include_router(reports.router, prefix=API_PREFIX)
-app.include_router(pipeline.router, prefix=API_PREFIX)
+ROUTERS = (insurees, files, endorsements, submissions, review, reports, pipeline)
+for module in ROUTERS:
+    app.include_router(module.router, prefix=API_PREFIX)
 
 
 # ─── Health Check ─────────────────────────────
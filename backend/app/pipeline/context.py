@@ -23,7 +23,7 @@ from typing import Any
 #  FileInfo — per-file metadata within a batch
 # ═══════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """
     Metadata for a single file within a multi-file batch.
@@ -69,7 +69,7 @@ class FileInfo:
 #  StepResult
 # ═══════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """Outcome of a single pipeline step execution."""
 
@@ -98,7 +98,7 @@ class StepResult:
 #  PipelineContext
 # ═══════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class PipelineContext:
     """
     Carries all state between pipeline steps.
@@ -176,6 +176,13 @@ class PipelineContext:
     # ─── Arbitrary step-to-step data ───────────────────
     extra: dict[str, Any] = field(default_factory=dict)
 
+    # ─── Internal indexes (not serialized) ─────────────
+    # role → [FileInfo], maintained by add_file so role lookups are O(1)
+    # instead of scanning self.files per call.
+    _files_by_role: dict[str, list[FileInfo]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
     # ─── File helpers ──────────────────────────────────
 
     @property
@@ -190,14 +197,12 @@ class PipelineContext:
 
     def get_file_by_role(self, role: str) -> FileInfo | None:
         """Find a file by its role label."""
-        for f in self.files:
-            if f.role == role:
-                return f
-        return None
+        matches = self._files_by_role.get(role)
+        return matches[0] if matches else None
 
     def get_files_by_role(self, role: str) -> list[FileInfo]:
         """Find all files matching a role (if duplicates exist)."""
-        return [f for f in self.files if f.role == role]
+        return self._files_by_role.get(role, [])
 
     def get_extracted_for_role(self, role: str) -> list[dict[str, Any]]:
         """Get the raw extracted records for a specific file role."""
@@ -206,6 +211,7 @@ class PipelineContext:
     def add_file(self, file_info: FileInfo) -> None:
         """Add a file to the batch."""
         self.files.append(file_info)
+        self._files_by_role.setdefault(file_info.role, []).append(file_info)
         # Update single-file shortcuts for the primary file
         if len(self.files) == 1:
             self.local_filepath = file_info.local_path
@@ -213,18 +219,41 @@ class PipelineContext:
             self.filename = file_info.filename
             self.detected_format = file_info.detected_format
 
+    def extend_files(self, file_infos: list[FileInfo]) -> None:
+        """Add a whole batch of files at once.
+
+        One list extend + one index pass instead of a method call per
+        file — the batch-ingestion path hands us the full list up front.
+        """
+        if not file_infos:
+            return
+        was_empty = not self.files
+        self.files.extend(file_infos)
+        by_role = self._files_by_role
+        for file_info in file_infos:
+            by_role.setdefault(file_info.role, []).append(file_info)
+        if was_empty:
+            primary = file_infos[0]
+            self.local_filepath = primary.local_path
+            self.s3_key = primary.s3_key
+            self.filename = primary.filename
+            self.detected_format = primary.detected_format
+
     def merge_extracted_to_flat(self) -> None:
         """
         Merge all per-role extracted data into the flat raw_extracted list.
         Called after all files have been extracted.
         Each record gets a '_source_role' field so you can trace its origin.
+
+        Shallow-copies each record instead of mutating it in place, so the
+        per-role dicts stay clean and don't serialize a stray
+        '_source_role' key when persisted per role.
         """
-        merged = []
-        for role, records in self.raw_extracted_by_role.items():
-            for record in records:
-                record["_source_role"] = role
-                merged.append(record)
-        self.raw_extracted = merged
+        self.raw_extracted = [
+            {**record, "_source_role": role}
+            for role, records in self.raw_extracted_by_role.items()
+            for record in records
+        ]
 
     # ─── General helpers ───────────────────────────────
 
@@ -5,14 +5,21 @@ Called by PipelineEngine after a run completes. Now UPDATES the existing
 PipelineRun row (created as PENDING by the trigger endpoint) rather than
 creating a new one.
 
-Uses a FRESH engine per call to avoid event loop conflicts when called
-from Celery workers (which use asyncio.run() in a sync context).
+Engines are cached per event loop: Celery workers run the whole pipeline
+inside one asyncio.run() loop, so every step persist within a run reuses
+the same pooled connections instead of paying a connect handshake per
+call. The cache is weak-keyed on the loop so a dead loop's engine can be
+collected; workers dispose explicitly via dispose_persist_engine().
 """
 
 from __future__ import annotations
 
+import asyncio
+import weakref
+from datetime import datetime
 from typing import Any
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.logging import get_logger
@@ -26,23 +33,87 @@ logger = get_logger(__name__)
 
 
 def _parse_dt(value):
-    """Convert ISO-format string to datetime, passthrough datetime/None."""
-    if value is None:
-        return None
+    """Convert ISO-format string to datetime, passthrough datetime/None.
+
+    Called a handful of times per step/file, so the common case — an
+    already-parsed datetime straight off a StepResult — is checked first.
+    """
+    if isinstance(value, datetime):
+        return value
     if isinstance(value, str):
-        from datetime import datetime
         try:
             return datetime.fromisoformat(value)
-        except (ValueError, TypeError):
+        except ValueError:
             return None
-    return value  # already a datetime
+    return None
+
+
+def _orjson_dumps(value: Any) -> str:
+    """JSONB serializer — orjson's C encoder; stdlib json dominates CPU on
+    runs that persist thousands of extracted records."""
+    return orjson.dumps(value).decode()
+
+
+_ENGINES: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
 
 def _make_session():
-    """Create a fresh async engine + session (avoids event loop conflicts in Celery)."""
-    engine = create_async_engine(settings.DATABASE_URL, echo=False)
-    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    return factory, engine
+    """Return the (sessionmaker, engine) pair for the running event loop.
+
+    Lazily constructed once per loop — one engine per loop is the correct
+    granularity for mixed API/Celery use (engines must not be shared
+    across loops, but recreating one per call threw away the pool)."""
+    loop = asyncio.get_running_loop()
+    cached = _ENGINES.get(loop)
+    if cached is None:
+        engine = create_async_engine(
+            settings.DATABASE_URL,
+            echo=False,
+            pool_size=5,
+            max_overflow=10,
+            pool_pre_ping=True,
+            json_serializer=_orjson_dumps,
+            json_deserializer=orjson.loads,
+        )
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        cached = (factory, engine)
+        _ENGINES[loop] = cached
+    return cached
+
+
+async def dispose_persist_engine() -> None:
+    """Dispose the cached engine for the current loop, if any.
+
+    Celery tasks call this before their asyncio.run() loop closes so
+    pooled connections are shut down cleanly. Drains any in-flight
+    background persists first."""
+    await drain_pending_persists()
+    cached = _ENGINES.pop(asyncio.get_running_loop(), None)
+    if cached is not None:
+        await cached[1].dispose()
+
+
+# ── Background persistence ────────────────────
+# Per-step persists are bookkeeping; scheduling them as tasks lets the
+# DB write overlap with the next step's work instead of sitting on the
+# pipeline critical path. Tasks are tracked so the engine can drain them
+# before the final result persist (step logs must land before the run
+# row flips to a terminal status).
+
+_PENDING_PERSISTS: set[asyncio.Task] = set()
+
+
+def schedule_persist_step_completed(**kwargs: Any) -> None:
+    """Fire persist_step_completed as a background task on the current loop."""
+    task = asyncio.get_running_loop().create_task(persist_step_completed(**kwargs))
+    _PENDING_PERSISTS.add(task)
+    task.add_done_callback(_PENDING_PERSISTS.discard)
+
+
+async def drain_pending_persists() -> None:
+    """Wait for all scheduled step persists to finish (errors already logged)."""
+    if _PENDING_PERSISTS:
+        await asyncio.gather(*list(_PENDING_PERSISTS), return_exceptions=True)
 
 
 async def persist_step_completed(
@@ -65,10 +136,9 @@ async def persist_step_completed(
     Called after each step completes (or fails/skips).
     Non-fatal: failures are logged, never raised.
     """
-    engine = None
     try:
         import uuid as uuid_mod
-        session_factory, engine = _make_session()
+        session_factory, _ = _make_session()
 
         async with session_factory() as session:
             async with session.begin():
@@ -82,7 +152,7 @@ async def persist_step_completed(
                     started_at=_parse_dt(started_at),
                     completed_at=_parse_dt(completed_at),
                     duration_ms=duration_ms,
-                    error_message=error_message,
+                    error_message=error_message[:2000] if error_message else None,
                     metadata_=metadata or {},
                     retry_count=retry_count,
                 )
@@ -113,9 +183,6 @@ async def persist_step_completed(
             step_name=step_name,
             error=str(exc),
         )
-    finally:
-        if engine:
-            await engine.dispose()
 
 
 async def persist_pipeline_result(
@@ -141,40 +208,49 @@ async def persist_pipeline_result(
     If a PipelineRun with matching UUID exists (created as PENDING by trigger),
     UPDATE it. Otherwise CREATE a new row (for backward compat with demo scripts).
     """
-    session_factory = None
-    engine = None
     try:
         import uuid as uuid_mod
-        from sqlalchemy import select as sa_select
+        from sqlalchemy import func, insert as sa_insert, update as sa_update
 
-        session_factory, engine = _make_session()
+        session_factory, _ = _make_session()
 
         async with session_factory() as session:
             async with session.begin():
-                # ── Try to find existing PENDING/RUNNING row ──
-                existing_run = None
+                # ── Update-first: the trigger endpoint created the row as
+                # PENDING, so issue the UPDATE directly and let RETURNING
+                # tell us whether it existed — no discovery SELECT.
+                run_uuid = None
                 try:
                     run_uuid = uuid_mod.UUID(execution_id)
-                    result = await session.execute(
-                        sa_select(PipelineRun).where(PipelineRun.id == run_uuid)
-                    )
-                    existing_run = result.scalar_one_or_none()
                 except (ValueError, AttributeError):
                     pass  # execution_id is not a UUID — create new
 
-                if existing_run:
-                    # ── UPDATE existing row ────────────────────
-                    existing_run.status = status
-                    existing_run.total_steps = total_steps
-                    existing_run.steps_completed = steps_completed
-                    existing_run.started_at = _parse_dt(started_at) or existing_run.started_at
-                    existing_run.completed_at = _parse_dt(completed_at)
-                    existing_run.duration_ms = duration_ms
-                    existing_run.error_message = error_message
-                    existing_run.config_snapshot = config_snapshot
-                    existing_run.context_summary = context_summary or {}
-                    run_id = existing_run.id
-                else:
+                existing_run = False
+                if run_uuid is not None:
+                    returned = await session.execute(
+                        sa_update(PipelineRun)
+                        .where(PipelineRun.id == run_uuid)
+                        .values(
+                            status=status,
+                            total_steps=total_steps,
+                            steps_completed=steps_completed,
+                            started_at=func.coalesce(
+                                _parse_dt(started_at), PipelineRun.started_at
+                            ),
+                            completed_at=_parse_dt(completed_at),
+                            duration_ms=duration_ms,
+                            error_message=error_message[:2000] if error_message else None,
+                            config_snapshot=config_snapshot,
+                            context_summary=context_summary or {},
+                        )
+                        .returning(PipelineRun.id)
+                    )
+                    row = returned.first()
+                    if row is not None:
+                        run_id = row[0]
+                        existing_run = True
+
+                if not existing_run:
                     # ── CREATE new row (demo/scripts) ──────────
                     run = PipelineRun(
                         insurer_code=insurer_code,
@@ -185,7 +261,7 @@ async def persist_pipeline_result(
                         started_at=_parse_dt(started_at),
                         completed_at=_parse_dt(completed_at),
                         duration_ms=duration_ms,
-                        error_message=error_message,
+                        error_message=error_message[:2000] if error_message else None,
                         config_snapshot=config_snapshot,
                         context_summary=context_summary or {},
                     )
@@ -193,48 +269,82 @@ async def persist_pipeline_result(
                     await session.flush()
                     run_id = run.id
 
-                # NOTE: PipelineStepLogs are persisted per-step by
-                # persist_step_completed() — no batch insert needed here.
+                # ── PipelineStepLogs ──────────────────────
+                # Existing runs already had their steps streamed in by
+                # persist_step_completed(); for freshly created rows (demo
+                # scripts calling this directly) insert all steps in one
+                # multi-row statement instead of a round trip per step.
+                if not existing_run and step_results:
+                    await session.execute(
+                        sa_insert(PipelineStepLog),
+                        [
+                            {
+                                "run_id": run_id,
+                                "step_index": idx,
+                                "step_name": sr.get("step_name", ""),
+                                "step_description": sr.get("step_description", ""),
+                                "status": sr.get("status", ""),
+                                "started_at": _parse_dt(sr.get("started_at")),
+                                "completed_at": _parse_dt(sr.get("completed_at")),
+                                "duration_ms": sr.get("duration_ms", 0),
+                                "error_message": (sr.get("error") or None) and sr.get("error")[:2000],
+                                "metadata_": sr.get("metadata") or {},
+                                "retry_count": sr.get("retry_count", 0),
+                            }
+                            for idx, sr in enumerate(step_results, start=1)
+                        ],
+                    )
 
                 # ── PipelineFiles ─────────────────────────
                 file_db_map = {}
 
                 if files:
-                    for fi in files:
-                        pf = PipelineFile(
-                            run_id=run_id,
-                            file_id=fi.get("file_id", ""),
-                            filename=fi.get("filename", ""),
-                            role=fi.get("role", "primary"),
-                            detected_format=fi.get("detected_format"),
-                            s3_key=fi.get("s3_key"),
-                            local_path=fi.get("local_path"),
-                            record_count=fi.get("record_count", 0),
-                            status="OK" if not fi.get("error") else "FAILED",
-                            error_message=fi.get("error"),
-                        )
-                        session.add(pf)
-                        await session.flush()
-                        file_db_map[fi.get("role", "primary")] = pf.id
+                    # Single multi-row INSERT ... RETURNING — one round
+                    # trip for the whole batch instead of a flush per file
+                    # just to learn each generated id.
+                    returned = await session.execute(
+                        sa_insert(PipelineFile).returning(
+                            PipelineFile.id, PipelineFile.role
+                        ),
+                        [
+                            {
+                                "run_id": run_id,
+                                "file_id": fi.get("file_id", ""),
+                                "filename": fi.get("filename", ""),
+                                "role": fi.get("role", "primary"),
+                                "detected_format": fi.get("detected_format"),
+                                "s3_key": fi.get("s3_key"),
+                                "local_path": fi.get("local_path"),
+                                "record_count": fi.get("record_count", 0),
+                                "status": "OK" if not fi.get("error") else "FAILED",
+                                "error_message": (fi.get("error") or None) and fi.get("error")[:2000],
+                            }
+                            for fi in files
+                        ],
+                    )
+                    for pf_id, pf_role in returned:
+                        file_db_map[pf_role] = pf_id
 
                 # ── PipelineExtractedData ─────────────────
                 if extracted_by_role:
-                    for role, records in extracted_by_role.items():
-                        if not records:
-                            continue
-                        first = records[0] if records else {}
-                        method = first.get("_extraction_method", "xls_extractor")
-                        model = first.get("_llm_model")
-
-                        ed = PipelineExtractedData(
-                            run_id=run_id,
-                            file_id=file_db_map.get(role),
-                            source_role=role,
-                            extraction_method=method,
-                            llm_model=model,
-                            data=records,
+                    ed_rows = [
+                        {
+                            "run_id": run_id,
+                            "file_id": file_db_map.get(role),
+                            "source_role": role,
+                            "extraction_method": records[0].get(
+                                "_extraction_method", "xls_extractor"
+                            ),
+                            "llm_model": records[0].get("_llm_model"),
+                            "data": records,
+                        }
+                        for role, records in extracted_by_role.items()
+                        if records
+                    ]
+                    if ed_rows:
+                        await session.execute(
+                            sa_insert(PipelineExtractedData), ed_rows
                         )
-                        session.add(ed)
 
         logger.info(
             "Pipeline result persisted to DB",
@@ -253,6 +363,3 @@ async def persist_pipeline_result(
             error=str(exc),
         )
         return None
-    finally:
-        if engine:
-            await engine.dispose()
@@ -13,15 +13,23 @@ Responsibilities:
 from __future__ import annotations
 
 import asyncio
+import logging
+import random
 import time
 import traceback
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 
 import structlog
 
-from app.core.constants import PipelineStatus, StepStatus
+from app.core.constants import (
+    PIPELINE_FAILED,
+    STEP_COMPLETED,
+    PipelineStatus,
+    StepStatus,
+)
 from app.pipeline.context import FileInfo, PipelineContext, StepResult
 from app.pipeline.errors import (
     FlowResolutionError,
@@ -32,7 +40,7 @@ from app.pipeline.errors import (
 from app.pipeline.step import PipelineStep
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     """Final outcome of a pipeline execution."""
 
@@ -48,6 +56,21 @@ class PipelineResult:
     error: str | None = None
 
 
+def _fail_result(
+    step: PipelineStep, error: str, metadata: dict[str, Any]
+) -> StepResult:
+    """Build a FAILED StepResult with a single wall-clock read."""
+    now = datetime.now(timezone.utc)
+    return StepResult(
+        step_name=step.name,
+        status=StepStatus.FAILED,
+        started_at=now,
+        completed_at=now,
+        error=error,
+        metadata=metadata,
+    )
+
+
 class PipelineEngine:
     """
     Runs a sequence of PipelineStep objects against a PipelineContext.
@@ -106,16 +129,15 @@ class PipelineEngine:
 
         # ── Populate files ────────────────────────────
         if files:
-            for f in files:
-                if isinstance(f, FileInfo):
-                    ctx.add_file(f)
-                elif isinstance(f, dict):
-                    ctx.add_file(FileInfo(
-                        file_id=f.get("file_id", f.get("id", "")),
-                        filename=f.get("filename", ""),
-                        role=f.get("role", "primary"),
-                        s3_key=f.get("s3_key"),
-                    ))
+            ctx.extend_files([
+                f if isinstance(f, FileInfo) else FileInfo(
+                    file_id=f.get("file_id", f.get("id", "")),
+                    filename=f.get("filename", ""),
+                    role=f.get("role", "primary"),
+                    s3_key=f.get("s3_key"),
+                )
+                for f in files
+            ])
 
         log = self.logger.bind(
             execution_id=ctx.execution_id,
@@ -125,11 +147,13 @@ class PipelineEngine:
             is_batch=ctx.is_batch,
         )
 
-        log.info(
-            "Pipeline started",
-            insuree_id=ctx.insuree_id,
-            file_roles=[f.role for f in ctx.files] if ctx.files else ["single"],
-        )
+        # Guard so the roles list isn't built when INFO is filtered out.
+        if logging.getLogger("pipeline.engine").isEnabledFor(logging.INFO):
+            log.info(
+                "Pipeline started",
+                insuree_id=ctx.insuree_id,
+                file_roles=[f.role for f in ctx.files] if ctx.files else ["single"],
+            )
 
         # ── Resolve steps ─────────────────────────────
         if self.flow_resolver is None:
@@ -178,7 +202,14 @@ class PipelineEngine:
     ) -> None:
         """Persist pipeline execution to database. Failures are logged, never raised."""
         try:
-            from app.pipeline.db_persist import persist_pipeline_result
+            from app.pipeline.db_persist import (
+                drain_pending_persists,
+                persist_pipeline_result,
+            )
+
+            # Step logs must land before the run row reaches a terminal
+            # status — wait out any persists still in flight.
+            await drain_pending_persists()
 
             # Build file dicts from context
             file_dicts = []
@@ -220,28 +251,82 @@ class PipelineEngine:
     async def run_steps(
         self,
         ctx: PipelineContext,
-        steps: list[PipelineStep],
+        steps: Sequence[PipelineStep | Sequence[PipelineStep]],
     ) -> PipelineResult:
         """
         Execute an ordered list of steps against a context.
 
+        A nested list is a PARALLEL GROUP: its members run concurrently
+        via asyncio.gather and the pipeline proceeds only when all of
+        them completed. Group members must touch disjoint context fields
+        and handle their own skip logic (should_skip is not consulted
+        for grouped steps).
+
         Can be called directly (bypassing flow resolution) for testing
         or when you have a pre-built step list.
         """
         started_at = datetime.now(timezone.utc)
-        ctx.total_steps = len(steps)
+        # Durations come off the monotonic clock — cheaper than wall-clock
+        # reads and immune to NTP adjustments mid-run.
+        t0 = time.perf_counter_ns()
+        total_steps = sum(
+            len(item) if isinstance(item, (list, tuple)) else 1 for item in steps
+        )
+        ctx.total_steps = total_steps
 
         log = self.logger.bind(
             execution_id=ctx.execution_id,
-            total_steps=len(steps),
+            total_steps=total_steps,
         )
 
         pipeline_status = PipelineStatus.RUNNING
         steps_completed = 0
+        step_number = 0
 
         for index, step in enumerate(steps):
             ctx.current_step_index = index
-            step_number = index + 1
+
+            # ── Parallel group ────────────────────────
+            if isinstance(step, (list, tuple)):
+                group = step
+                numbers = []
+                coros = []
+                for member in group:
+                    step_number += 1
+                    numbers.append(step_number)
+                    coros.append(
+                        self._execute_with_retry(
+                            member,
+                            ctx,
+                            log.bind(step_name=member.name, step_index=step_number),
+                        )
+                    )
+                log.info(
+                    "Parallel group starting",
+                    group=[member.name for member in group],
+                )
+                # _execute_with_retry never raises — failures come back
+                # as FAILED StepResults.
+                results = await asyncio.gather(*coros)
+
+                group_failed = False
+                for member, number, result in zip(group, numbers, results):
+                    ctx.step_results.append(result)
+                    if result.status == STEP_COMPLETED:
+                        steps_completed += 1
+                    else:
+                        group_failed = True
+                        ctx.add_error(f"Step '{member.name}' failed: {result.error}")
+                    await self._persist_step(
+                        ctx, result, number, steps_completed, total_steps
+                    )
+                if group_failed:
+                    pipeline_status = PipelineStatus.FAILED
+                    log.error("Parallel group failed — pipeline stopping")
+                    break
+                continue
+
+            step_number += 1
 
             step_log = log.bind(
                 step_name=step.name,
@@ -250,41 +335,41 @@ class PipelineEngine:
             )
 
             # ── Check skip condition ──────────────────
-            try:
-                if await step.should_skip(ctx):
-                    step_log.info("Step skipped")
-                    skip_result = StepResult(
-                        step_name=step.name,
-                        status=StepStatus.SKIPPED,
-                        started_at=datetime.now(timezone.utc),
-                        completed_at=datetime.now(timezone.utc),
-                    )
-                    ctx.step_results.append(skip_result)
-                    steps_completed += 1
+            # should_skip is contractually non-raising (see PipelineStep),
+            # so no defensive try/except in the hot loop.
+            if await step.should_skip(ctx):
+                step_log.debug("Step skipped")
+                now = datetime.now(timezone.utc)
+                skip_result = StepResult(
+                    step_name=step.name,
+                    status=StepStatus.SKIPPED,
+                    started_at=now,
+                    completed_at=now,
+                )
+                ctx.step_results.append(skip_result)
+                steps_completed += 1
 
-                    # Persist skipped step
-                    await self._persist_step(ctx, skip_result, step_number, steps_completed, len(steps))
-                    continue
-            except Exception as exc:
-                step_log.warning("should_skip raised, running step anyway", error=str(exc))
+                # Persist skipped step
+                await self._persist_step(ctx, skip_result, step_number, steps_completed, total_steps)
+                continue
 
             # ── Execute step (with retry) ─────────────
-            step_log.info(
-                f"Step {step_number}/{len(steps)}: {step.description}",
-            )
+            # Per-step progress is DEBUG; the end-of-run trace (below)
+            # carries the full step picture in one INFO record.
+            step_log.debug("Step starting")
 
             result = await self._execute_with_retry(step, ctx, step_log)
             ctx.step_results.append(result)
 
-            if result.status == StepStatus.COMPLETED:
+            if result.status == STEP_COMPLETED:
                 steps_completed += 1
-                step_log.info(
+                step_log.debug(
                     "Step completed",
                     duration_ms=result.duration_ms,
                     metadata=result.metadata,
                 )
                 # Persist completed step
-                await self._persist_step(ctx, result, step_number, steps_completed, len(steps))
+                await self._persist_step(ctx, result, step_number, steps_completed, total_steps)
             else:
                 step_log.error(
                     "Step failed — pipeline stopping",
@@ -295,7 +380,7 @@ class PipelineEngine:
                 pipeline_status = PipelineStatus.FAILED
 
                 # Persist failed step
-                await self._persist_step(ctx, result, step_number, steps_completed, len(steps))
+                await self._persist_step(ctx, result, step_number, steps_completed, total_steps)
 
                 # Attempt rollback
                 try:
@@ -308,11 +393,26 @@ class PipelineEngine:
 
         # ── Finalise ──────────────────────────────────
         completed_at = datetime.now(timezone.utc)
-        total_duration_ms = int((completed_at - started_at).total_seconds() * 1000)
+        total_duration_ms = (time.perf_counter_ns() - t0) // 1_000_000
 
-        if pipeline_status != PipelineStatus.FAILED:
+        if pipeline_status != PIPELINE_FAILED:
             pipeline_status = PipelineStatus.COMPLETED
 
+        # One aggregate trace instead of 2+ records per step; failures
+        # were already logged live at ERROR above.
+        log.info(
+            "Pipeline trace",
+            status=pipeline_status,
+            steps=[
+                {
+                    "step_name": sr.step_name,
+                    "status": sr.status,
+                    "duration_ms": sr.duration_ms,
+                }
+                for sr in ctx.step_results
+            ],
+        )
+
         return PipelineResult(
             execution_id=ctx.execution_id,
             status=pipeline_status,
@@ -320,7 +420,7 @@ class PipelineEngine:
             completed_at=completed_at,
             total_duration_ms=total_duration_ms,
             steps_completed=steps_completed,
-            total_steps=len(steps),
+            total_steps=total_steps,
             step_results=[sr.to_dict() for sr in ctx.step_results],
             context_summary=ctx.to_summary_dict(),
         )
@@ -333,11 +433,16 @@ class PipelineEngine:
         steps_completed: int,
         total_steps: int,
     ) -> None:
-        """Persist a single step result to DB. Non-fatal."""
+        """Persist a single step result to DB. Non-fatal.
+
+        Scheduled as a background task so the write overlaps with the next
+        step instead of blocking between steps; _persist_to_db drains all
+        pending step persists before writing the final run row.
+        """
         try:
-            from app.pipeline.db_persist import persist_step_completed
+            from app.pipeline.db_persist import schedule_persist_step_completed
 
-            await persist_step_completed(
+            schedule_persist_step_completed(
                 run_id=ctx.execution_id,
                 step_index=step_number,
                 step_name=step_result.step_name,
@@ -368,48 +473,68 @@ class PipelineEngine:
         """
         Execute a step.  If retryable and it fails, retry up to max_retries.
         """
-        max_attempts = step.max_retries if step.retryable else 1
+        # Bind hot attributes to locals once — the retry loop re-reads
+        # them every attempt otherwise (attribute + descriptor lookup).
+        execute = step.execute
+        name = step.name
+        retryable = step.retryable
+        max_attempts = step.max_retries if retryable else 1
+
+        timeout = step.timeout_seconds
 
         for attempt in range(1, max_attempts + 1):
             try:
-                result = await step.execute(ctx)
+                if timeout:
+                    try:
+                        result = await asyncio.wait_for(execute(ctx), timeout)
+                    except asyncio.TimeoutError:
+                        raise StepExecutionError(
+                            f"Step timed out after {timeout}s",
+                            step_name=name,
+                        ) from None
+                else:
+                    result = await execute(ctx)
                 return result
 
             except StepExecutionError as exc:
-                if step.retryable and attempt < max_attempts:
-                    wait_seconds = 2 ** attempt  # exponential backoff
+                if retryable and attempt < max_attempts:
+                    # Capped exponential backoff with full jitter so
+                    # concurrent pipelines hitting the same failing
+                    # backend don't retry in lockstep.
+                    wait_seconds = min(2 ** attempt, 30) * (0.5 + random.random())
                     log.warning(
-                        f"Step failed (attempt {attempt}/{max_attempts}), retrying in {wait_seconds}s",
+                        "Step failed, retrying",
+                        attempt=attempt,
+                        max_attempts=max_attempts,
+                        retry_in_s=round(wait_seconds, 1),
                         error=str(exc),
                     )
                     await asyncio.sleep(wait_seconds)
                     continue
 
                 # Final failure
-                return StepResult(
-                    step_name=step.name,
-                    status=StepStatus.FAILED,
-                    started_at=datetime.now(timezone.utc),
-                    completed_at=datetime.now(timezone.utc),
-                    error=str(exc),
-                    metadata={"attempts": attempt},
-                )
+                return _fail_result(step, str(exc), {"attempts": attempt})
 
             except Exception as exc:
-                # Unexpected error — never retry
+                # Unexpected error — never retry. log.exception already
+                # captures the traceback; only pay for a second formatted
+                # copy in the step metadata when DEBUG is on.
                 log.exception("Unexpected error in step", error=str(exc))
-                return StepResult(
-                    step_name=step.name,
-                    status=StepStatus.FAILED,
-                    started_at=datetime.now(timezone.utc),
-                    completed_at=datetime.now(timezone.utc),
-                    error=f"Unexpected: {exc}",
-                    metadata={"traceback": traceback.format_exc()},
-                )
+                # Metadata lands in JSONB, so a deferred/lazy traceback
+                # object can't survive serialization. Record the cheap
+                # structured facts unconditionally and only pay for the
+                # full formatted traceback when DEBUG is on.
+                meta: dict[str, Any] = {
+                    "exc_type": type(exc).__name__,
+                    "traceback": None,
+                }
+                if logging.getLogger("pipeline.engine").isEnabledFor(logging.DEBUG):
+                    meta["traceback"] = traceback.format_exc()
+                return _fail_result(step, f"Unexpected: {exc}", meta)
 
         # Should not reach here, but safety net
         return StepResult(
-            step_name=step.name,
+            step_name=name,
             status=StepStatus.FAILED,
             error="Retry loop exited unexpectedly",
         )
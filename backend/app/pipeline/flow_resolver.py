@@ -18,6 +18,7 @@ To add a new insurer flow:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
 from app.core.logging import get_logger
@@ -42,26 +43,35 @@ from app.pipeline.insurers.abhi.flow import abhi_flow
 logger = get_logger(__name__)
 
 
-def _common_pre_steps() -> list[PipelineStep]:
-    """Steps that run for EVERY insurer before extraction."""
-    return [
-        DownloadFileStep(),
-        DetectFormatStep(),
-    ]
+# Steps are stateless singletons (per-run state lives in ctx), so each
+# flow is a tuple built once at import — resolve() hands back the same
+# immutable sequence every time instead of re-instantiating steps.
 
+# Steps that run for EVERY insurer before extraction.
+_COMMON_PRE_STEPS: tuple[PipelineStep, ...] = (
+    DownloadFileStep(),
+    DetectFormatStep(),
+)
 
-def _common_post_steps() -> list[PipelineStep]:
-    """Steps that run for EVERY insurer after extraction + mapping."""
-    return [
-        ValidateSchemaStep(),
-        ValidateBusinessRulesStep(),
-        DetectDuplicatesStep(),
-        ScoreConfidenceStep(),
-        PersistRecordsStep(),
-    ]
+# Steps that run for EVERY insurer after extraction + mapping.
+_COMMON_POST_STEPS: tuple[PipelineStep, ...] = (
+    ValidateSchemaStep(),
+    ValidateBusinessRulesStep(),
+    DetectDuplicatesStep(),
+    ScoreConfidenceStep(),
+    PersistRecordsStep(),
+)
 
 
-def _default_flow() -> list[PipelineStep]:
+_DEFAULT_STEPS: tuple[PipelineStep, ...] = (
+    *_COMMON_PRE_STEPS,
+    ExtractDataStep(),
+    MapCanonicalStep(),
+    *_COMMON_POST_STEPS,
+)
+
+
+def _default_flow() -> Sequence[PipelineStep]:
     """
     Default flow — works for both single and multi-file.
 
@@ -72,15 +82,35 @@ def _default_flow() -> list[PipelineStep]:
     For multi-file runs: ctx.files has N entries, each with a role.
     ExtractDataStep handles both transparently.
     """
-    return [
-        *_common_pre_steps(),
-        ExtractDataStep(),
-        MapCanonicalStep(),
-        *_common_post_steps(),
-    ]
-
-
-def _example_insurer_a_flow() -> list[PipelineStep]:
+    return _DEFAULT_STEPS
+
+
+_INSURER_A_STEPS: tuple[PipelineStep, ...] = (
+    *_COMMON_PRE_STEPS,
+    ExtractDataStep(),
+    # ── Custom: call insurer A's member lookup API ──
+    # Uses data extracted from the "endorsement_actions" role
+    APIRequestStep(
+        step_name="insurer_a_member_lookup",
+        step_description="Call Insurer A member lookup API to enrich records",
+        method="POST",
+        url_template="{base_url}/api/members/lookup",
+        request_builder=lambda ctx: {
+            "members": [
+                {"name": r.get("name"), "employee_id": r.get("employee_id")}
+                for r in ctx.get_extracted_for_role("endorsement_actions")
+            ],
+            "roster_count": len(ctx.get_extracted_for_role("member_data")),
+        },
+        response_key="member_lookup_response",
+        retryable=True,
+    ),
+    MapCanonicalStep(),
+    *_COMMON_POST_STEPS,
+)
+
+
+def _example_insurer_a_flow() -> Sequence[PipelineStep]:
     """
     Example: Insurer A — multi-file batch.
 
@@ -91,32 +121,42 @@ def _example_insurer_a_flow() -> list[PipelineStep]:
     After extracting both files, calls member lookup API to enrich
     the data before canonical mapping.
     """
-    return [
-        *_common_pre_steps(),
-        ExtractDataStep(),
-        # ── Custom: call insurer A's member lookup API ──
-        # Uses data extracted from the "endorsement_actions" role
-        APIRequestStep(
-            step_name="insurer_a_member_lookup",
-            step_description="Call Insurer A member lookup API to enrich records",
-            method="POST",
-            url_template="{base_url}/api/members/lookup",
-            request_builder=lambda ctx: {
-                "members": [
-                    {"name": r.get("name"), "employee_id": r.get("employee_id")}
-                    for r in ctx.get_extracted_for_role("endorsement_actions")
-                ],
-                "roster_count": len(ctx.get_extracted_for_role("member_data")),
-            },
-            response_key="member_lookup_response",
-            retryable=True,
-        ),
-        MapCanonicalStep(),
-        *_common_post_steps(),
-    ]
-
-
-def _example_insurer_b_flow() -> list[PipelineStep]:
+    return _INSURER_A_STEPS
+
+
+_INSURER_B_STEPS: tuple[PipelineStep, ...] = (
+    *_COMMON_PRE_STEPS,
+    # ── Custom: fetch policy details first ──
+    APIRequestStep(
+        step_name="insurer_b_fetch_policy",
+        step_description="Fetch active policy details from Insurer B API",
+        method="GET",
+        url_template="{base_url}/api/policies/{policy_id}",
+        response_key="policy_details_api",
+        retryable=True,
+    ),
+    ExtractDataStep(),
+    MapCanonicalStep(),
+    # ── Custom: create endorsement batch request via POST ──
+    APIRequestStep(
+        step_name="insurer_b_create_endorsement",
+        step_description="Create endorsement request via Insurer B API",
+        method="POST",
+        url_template="{base_url}/api/endorsements",
+        request_builder=lambda ctx: {
+            "policy_id": ctx.get_extra("policy_details_api", {}).get("id"),
+            "records": ctx.canonical_records,
+            "files_processed": len(ctx.files),
+            "approval_data": ctx.get_extracted_for_role("approval_letter"),
+        },
+        response_key="endorsement_creation_response",
+        retryable=True,
+    ),
+    *_COMMON_POST_STEPS,
+)
+
+
+def _example_insurer_b_flow() -> Sequence[PipelineStep]:
     """
     Example: Insurer B — multi-file batch with multiple API stages.
 
@@ -133,36 +173,7 @@ def _example_insurer_b_flow() -> list[PipelineStep]:
         5. Create endorsement request via POST API
         6. Validate + score + persist
     """
-    return [
-        *_common_pre_steps(),
-        # ── Custom: fetch policy details first ──
-        APIRequestStep(
-            step_name="insurer_b_fetch_policy",
-            step_description="Fetch active policy details from Insurer B API",
-            method="GET",
-            url_template="{base_url}/api/policies/{policy_id}",
-            response_key="policy_details_api",
-            retryable=True,
-        ),
-        ExtractDataStep(),
-        MapCanonicalStep(),
-        # ── Custom: create endorsement batch request via POST ──
-        APIRequestStep(
-            step_name="insurer_b_create_endorsement",
-            step_description="Create endorsement request via Insurer B API",
-            method="POST",
-            url_template="{base_url}/api/endorsements",
-            request_builder=lambda ctx: {
-                "policy_id": ctx.get_extra("policy_details_api", {}).get("id"),
-                "records": ctx.canonical_records,
-                "files_processed": len(ctx.files),
-                "approval_data": ctx.get_extracted_for_role("approval_letter"),
-            },
-            response_key="endorsement_creation_response",
-            retryable=True,
-        ),
-        *_common_post_steps(),
-    ]
+    return _INSURER_B_STEPS
 
 
 # ═══════════════════════════════════════════════════════════
@@ -194,8 +205,19 @@ class FlowResolver:
 
     def __init__(self, registry: dict[str, callable] | None = None) -> None:
         self.registry = registry or FLOW_REGISTRY
-
-    def resolve(self, insuree_config: dict[str, Any]) -> list[PipelineStep]:
+        # Steps are stateless (execution state lives in ctx), so resolved
+        # lists are memoized per registry key instead of re-instantiating
+        # every step object on each run.
+        self._cache: dict[str, Sequence[PipelineStep]] = {}
+
+    def _resolved(self, key: str) -> Sequence[PipelineStep]:
+        """Build (once) and return the step list registered under key."""
+        steps = self._cache.get(key)
+        if steps is None:
+            steps = self._cache[key] = self.registry[key]()
+        return steps
+
+    def resolve(self, insuree_config: dict[str, Any]) -> Sequence[PipelineStep]:
         """
         Return the ordered step list for the given insurer.
 
@@ -203,7 +225,7 @@ class FlowResolver:
             insuree_config: Dict with at least "code" key.
 
         Returns:
-            Ordered list of PipelineStep instances.
+            Ordered sequence of PipelineStep instances.
 
         Raises:
             FlowResolutionError: If no matching flow is found and no DEFAULT.
@@ -211,35 +233,21 @@ class FlowResolver:
         insuree_code = insuree_config.get("code", "")
         flow_type = insuree_config.get("flow_type", "")
 
-        # Try exact code match
+        # Single dispatch: code, then flow_type, then DEFAULT.
         if insuree_code in self.registry:
-            logger.info(
-                "Flow resolved by insurer code",
-                insuree_code=insuree_code,
-            )
-            return self.registry[insuree_code]()
-
-        # Try flow_type match
-        if flow_type and flow_type in self.registry:
-            logger.info(
-                "Flow resolved by flow_type",
-                flow_type=flow_type,
-                insuree_code=insuree_code,
-            )
-            return self.registry[flow_type]()
-
-        # Fall back to DEFAULT
-        if "DEFAULT" in self.registry:
-            logger.info(
-                "Flow resolved to DEFAULT",
-                insuree_code=insuree_code,
+            matched = insuree_code
+        elif flow_type and flow_type in self.registry:
+            matched = flow_type
+        elif "DEFAULT" in self.registry:
+            matched = "DEFAULT"
+        else:
+            raise FlowResolutionError(
+                f"No flow registered for insurer '{insuree_code}' and no DEFAULT flow",
+                step_name="flow_resolution",
             )
-            return self.registry["DEFAULT"]()
 
-        raise FlowResolutionError(
-            f"No flow registered for insurer '{insuree_code}' and no DEFAULT flow",
-            step_name="flow_resolution",
-        )
+        logger.debug("Flow resolved", matched=matched, insuree_code=insuree_code)
+        return self._resolved(matched)
 
     def list_available_flows(self) -> list[str]:
         """Return all registered flow keys."""
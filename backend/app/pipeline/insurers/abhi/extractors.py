@@ -9,7 +9,9 @@ Supports both .xls (via xlrd) and .xlsx (via openpyxl) formats.
 
 from __future__ import annotations
 
+import functools
 import os
+import re
 from typing import Any
 
 from app.core.logging import get_logger
@@ -22,42 +24,63 @@ logger = get_logger(__name__)
 # ═══════════════════════════════════════════════════════════
 
 class XlrdSheetAdapter:
-    """Adapter for xlrd sheets (0-based indexing)."""
+    """Adapter for xlrd sheets (0-based indexing).
+
+    Values are materialized once via the bulk row_values accessor —
+    every extraction phase re-walks the grid, so per-cell cell_value
+    calls would pay the Cell dispatch O(passes x rows x cols) times.
+    """
 
     def __init__(self, sheet) -> None:
-        self._s = sheet
+        import xlrd  # importable here — _load_sheet already imported it
+
         self.nrows = sheet.nrows
         self.ncols = sheet.ncols
+        # row_types (also one C-level call per row) identifies empty and
+        # blank cells directly, so emptiness is resolved once here and
+        # raw_value is a bare double index.
+        empty_types = (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK)
+        self._grid = [
+            [
+                None if cell_type in empty_types or value == "" else value
+                for value, cell_type in zip(sheet.row_values(r), sheet.row_types(r))
+            ]
+            for r in range(sheet.nrows)
+        ]
+        self._merges = list(sheet.merged_cells)
 
     def raw_value(self, r: int, c: int) -> Any:
-        value = self._s.cell_value(r, c)
-        return value if value != "" else None
+        return self._grid[r][c]
 
     def merged_ranges(self):
-        for rlo, rhi, clo, chi in self._s.merged_cells:
-            yield rlo, rhi, clo, chi
+        yield from self._merges
 
 
 class OpenpyxlSheetAdapter:
-    """Adapter for openpyxl worksheets (converts 1-based to 0-based)."""
+    """Adapter over a materialized XLSX sheet (0-based indexing).
+
+    Built from a read-only streaming load: cell values are captured in
+    a dense 2D list in one pass and merged ranges are parsed straight
+    from the sheet XML (read-only worksheets expose no merged_cells),
+    so the full workbook DOM is never constructed.
+    """
 
-    def __init__(self, ws) -> None:
-        self._ws = ws
-        self.nrows = ws.max_row
-        self.ncols = ws.max_column
+    def __init__(self, grid: list[list[Any]], merges: list[tuple[int, int, int, int]]) -> None:
+        self.nrows = len(grid)
+        self.ncols = max((len(row) for row in grid), default=0)
+        # Streaming rows can come back ragged — pad to a rectangle so
+        # raw_value never needs a bounds check.
+        for row in grid:
+            if len(row) < self.ncols:
+                row.extend([None] * (self.ncols - len(row)))
+        self._grid = grid
+        self._merges = merges
 
     def raw_value(self, r: int, c: int) -> Any:
-        value = self._ws.cell(r + 1, c + 1).value
-        return value if value is not None else None
+        return self._grid[r][c]
 
     def merged_ranges(self):
-        for merged_range in self._ws.merged_cells.ranges:
-            yield (
-                merged_range.min_row - 1,
-                merged_range.max_row,
-                merged_range.min_col - 1,
-                merged_range.max_col,
-            )
+        yield from self._merges
 
 
 # ═══════════════════════════════════════════════════════════
@@ -85,27 +108,85 @@ def _load_sheet(path: str):
             raise ImportError(
                 "openpyxl is required for .xlsx files. Install with: pip install openpyxl"
             ) from exc
-        workbook = load_workbook(path)
-        return OpenpyxlSheetAdapter(workbook.active)
+        # read_only streams rows instead of building the full workbook
+        # DOM — orders of magnitude less RAM and load time on big
+        # sheets.  data_only resolves formulas to cached values, which
+        # is all the extractor ever reads.
+        workbook = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+        try:
+            worksheet = workbook.active
+            grid = [list(row) for row in worksheet.iter_rows(values_only=True)]
+            merges = _read_xlsx_merged_ranges(workbook, worksheet)
+        finally:
+            workbook.close()
+        return OpenpyxlSheetAdapter(grid, merges)
 
     raise ValueError(f"Unsupported extension: {extension}")
 
 
-def _build_merged_lookup(sheet) -> dict[tuple[int, int], Any]:
-    """Build a lookup: (row, col) → top-left value for all merged cells."""
-    lookup = {}
+def _read_xlsx_merged_ranges(workbook, worksheet) -> list[tuple[int, int, int, int]]:
+    """Parse merged ranges from the sheet XML of a read-only workbook.
+
+    Read-only worksheets don't carry merged_cells, but the mergeCell
+    elements sit in the already-open archive — one targeted XML scan is
+    far cheaper than re-loading the workbook DOM just for merges.
+    Returns (rlo, rhi, clo, chi) tuples in the adapter's 0-based,
+    end-exclusive convention.
+    """
+    import xml.etree.ElementTree as ET
+
+    from openpyxl.utils.cell import range_boundaries
+
+    try:
+        source = workbook._archive.read(worksheet._worksheet_path.lstrip("/"))
+    except (AttributeError, KeyError) as exc:
+        logger.warning("Could not read sheet XML for merged ranges", error=str(exc))
+        return []
+
+    ns = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+    merges = []
+    for merge_cell in ET.fromstring(source).iter(f"{ns}mergeCell"):
+        min_col, min_row, max_col, max_row = range_boundaries(merge_cell.get("ref"))
+        merges.append((min_row - 1, max_row, min_col - 1, max_col))
+    return merges
+
+
+def _build_merge_index(sheet) -> dict[int, list[tuple[int, int, Any]]]:
+    """Build a per-row merge interval table: row → [(clo, chi, value), ...].
+
+    Storage is proportional to merged rows x merges per row rather than
+    total merged cells, so a title banner merged across a whole sheet
+    costs one interval instead of one entry per covered cell. Rows with
+    no merges aren't present at all, which keeps the common _value_at
+    miss a single dict probe.
+    """
+    index: dict[int, list[tuple[int, int, Any]]] = {}
     for rlo, rhi, clo, chi in sheet.merged_ranges():
-        top_left = sheet.raw_value(rlo, clo)
+        value = sheet.raw_value(rlo, clo)
         for row in range(rlo, rhi):
-            for col in range(clo, chi):
-                lookup[(row, col)] = top_left
-    return lookup
+            index.setdefault(row, []).append((clo, chi, value))
+    return index
 
 
-def _value_at(sheet, row: int, col: int, merged_lookup: dict) -> Any:
+def _value_at(
+    sheet, row: int, col: int, merge_index: dict[int, list[tuple[int, int, Any]]]
+) -> Any:
     """Get the effective value at (row, col), respecting merged cells."""
     value = sheet.raw_value(row, col)
-    return value if value is not None else merged_lookup.get((row, col))
+    if value is not None:
+        return value
+    intervals = merge_index.get(row)
+    if intervals:
+        for clo, chi, merged_value in intervals:
+            if clo <= col < chi:
+                return merged_value
+    return None
+
+
+# Plain decimal forms ("42", "1,234", "3.5") — the overwhelmingly common
+# serial-cell shape. Matching here skips the exception-driven float()
+# path, which is the slow branch when _extract_table probes every row.
+_SERIAL_RE = re.compile(r"-?\d[\d,]*\.?\d*$")
 
 
 def _is_serial_value(value) -> bool:
@@ -115,41 +196,66 @@ def _is_serial_value(value) -> bool:
     if isinstance(value, (int, float)):
         return True
     if isinstance(value, str):
-        text = value.strip().replace(",", "")
+        text = value.strip()
         if not text:
             return False
+        if _SERIAL_RE.match(text):
+            return True
+        # Rare numeric spellings (exponents, leading dot) still count.
         try:
-            float(text)
+            float(text.replace(",", ""))
             return True
         except ValueError:
             return False
     return False
 
 
+# \W plus underscore is exactly the complement of isalnum (letters and
+# digits, unicode included) — one C-level sub instead of a per-character
+# Python generator.
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+_SERIAL_ALIASES = frozenset({"srno", "sno", "serialno", "serialnumber", "srnumber"})
+
+
+@functools.lru_cache(maxsize=256)
 def _header_looks_serial(header_name: str) -> bool:
-    """Check if a header name refers to a serial number column."""
-    normalized = "".join(ch for ch in header_name.lower() if ch.isalnum())
-    serial_aliases = {"srno", "sno", "serialno", "serialnumber", "srnumber"}
-    return normalized in serial_aliases or normalized.startswith("srno")
+    """Check if a header name refers to a serial number column.
+
+    Cached — the same handful of header names recurs across files.
+    """
+    normalized = _NON_ALNUM_RE.sub("", header_name.lower())
+    return normalized in _SERIAL_ALIASES or normalized.startswith("srno")
+
+
+def _normalized_grid(sheet) -> list[list[str]]:
+    """Stringify + strip every cell exactly once.
 
+    Header-row detection and header extraction both classify cells by
+    their normalized text; sharing one pass avoids re-running
+    str().strip() over the grid per phase."""
+    raw_value = sheet.raw_value
+    return [
+        [
+            "" if (value := raw_value(row, col)) is None else str(value).strip()
+            for col in range(sheet.ncols)
+        ]
+        for row in range(sheet.nrows)
+    ]
 
-def _find_table_header_row(sheet) -> int:
+
+def _find_table_header_row(sheet, norm_grid: list[list[str]]) -> int:
     """Find the row that contains the table header (≥8 distinct values)."""
     for row in range(sheet.nrows):
-        distinct_values = set()
-        for col in range(sheet.ncols):
-            value = sheet.raw_value(row, col)
-            if value is None:
-                continue
-            normalized = str(value).strip()
-            if normalized:
-                distinct_values.add(normalized)
+        distinct_values = {value for value in norm_grid[row] if value}
         if len(distinct_values) >= 8:
             return row
     return sheet.nrows - 1
 
 
-def _extract_header(sheet, table_header_row: int) -> dict[str, Any]:
+def _extract_header(
+    sheet, norm_grid: list[list[str]], table_header_row: int
+) -> dict[str, Any]:
     """Extract key-value metadata from rows above the table header."""
     merge_top_lefts = {}
     merge_members = set()
@@ -169,15 +275,11 @@ def _extract_header(sheet, table_header_row: int) -> dict[str, Any]:
 
     for row in range(table_header_row):
         entries = []
+        norm_row = norm_grid[row]
         for col in range(sheet.ncols):
-            if (row, col) in merge_members:
-                continue
-            value = sheet.raw_value(row, col)
-            if value is None:
-                continue
-            if not str(value).strip():
+            if not norm_row[col] or (row, col) in merge_members:
                 continue
-            entries.append((col, value, merged_end(row, col)))
+            entries.append((col, sheet.raw_value(row, col), merged_end(row, col)))
 
         if not entries:
             continue
@@ -209,12 +311,14 @@ def _extract_header(sheet, table_header_row: int) -> dict[str, Any]:
 
 
 def _extract_table(
-    sheet, merged_lookup: dict, table_header_row: int
+    sheet,
+    merge_index: dict[int, list[tuple[int, int, Any]]],
+    table_header_row: int,
 ) -> tuple[list[dict[str, Any]], int]:
     """Extract tabular records starting from the header row."""
     column_names = {}
     for col in range(sheet.ncols):
-        value = _value_at(sheet, table_header_row, col, merged_lookup)
+        value = _value_at(sheet, table_header_row, col, merge_index)
         if value is None:
             continue
         normalized = str(value).strip()
@@ -234,7 +338,7 @@ def _extract_table(
     for row_index in range(table_header_row + 1, sheet.nrows):
         row_obj = {}
         for col in ordered_cols:
-            value = _value_at(sheet, row_index, col, merged_lookup)
+            value = _value_at(sheet, row_index, col, merge_index)
             if isinstance(value, str):
                 value = value.strip() or None
             row_obj[column_names[col]] = value
@@ -261,7 +365,9 @@ def _extract_table(
 
 
 def _extract_summary(
-    sheet, merged_lookup: dict, data_end_row: int
+    sheet,
+    merge_index: dict[int, list[tuple[int, int, Any]]],
+    data_end_row: int,
 ) -> dict[str, Any]:
     """Extract summary key-value pairs from rows below the table."""
     summary: dict[str, Any] = {}
@@ -269,7 +375,7 @@ def _extract_summary(
     for row in range(data_end_row, sheet.nrows):
         cells = []
         for col in range(sheet.ncols):
-            value = _value_at(sheet, row, col, merged_lookup)
+            value = _value_at(sheet, row, col, merge_index)
             if value is None:
                 continue
             text = str(value).strip()
@@ -334,11 +440,12 @@ def extract_xls(path: str) -> dict[str, Any]:
     logger.info("ABHI XLS extraction starting", path=path)
 
     sheet = _load_sheet(path)
-    merged_lookup = _build_merged_lookup(sheet)
-    table_header_row = _find_table_header_row(sheet)
-    header = _extract_header(sheet, table_header_row)
-    records, data_end_row = _extract_table(sheet, merged_lookup, table_header_row)
-    summary = _extract_summary(sheet, merged_lookup, data_end_row)
+    merge_index = _build_merge_index(sheet)
+    norm_grid = _normalized_grid(sheet)
+    table_header_row = _find_table_header_row(sheet, norm_grid)
+    header = _extract_header(sheet, norm_grid, table_header_row)
+    records, data_end_row = _extract_table(sheet, merge_index, table_header_row)
+    summary = _extract_summary(sheet, merge_index, data_end_row)
 
     title = header.pop("_title", None)
     result: dict[str, Any] = {}
@@ -8,7 +8,9 @@ ABHIExtractDataStep handles two file roles:
 
 from __future__ import annotations
 
+import asyncio
 import json
+import weakref
 from typing import Any
 
 from app.core.config import settings
@@ -23,6 +25,31 @@ from app.pipeline.insurers.abhi.prompts import ENDORSEMENT_PDF_PROMPT, SYSTEM_PR
 logger = get_logger(__name__)
 
 
+_GENAI_CLIENTS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_genai_client():
+    """Return the google-genai client for the running event loop.
+
+    Reusing one client lets httpx keep-alive carry the TCP+TLS session
+    across successive uploads and generate_content calls — but the
+    client.aio surface binds its connection pool to the loop it first
+    runs on, and Celery tasks each run in a fresh asyncio.run() loop, so
+    a process-wide client would resurface dead keep-alive connections.
+    Cache per running loop instead, weak-keyed so a finished loop's
+    client can be collected (same granularity as the persist-engine
+    cache in db_persist).
+    """
+    loop = asyncio.get_running_loop()
+    client = _GENAI_CLIENTS.get(loop)
+    if client is None:
+        from google import genai
+
+        client = genai.Client(api_key=settings.GOOGLE_API_KEY)
+        _GENAI_CLIENTS[loop] = client
+    return client
+
+
 class ABHIExtractDataStep(PipelineStep):
     """
     ABHI extraction step.
@@ -47,36 +74,15 @@ class ABHIExtractDataStep(PipelineStep):
                 step_name=self.name,
             )
 
-        per_file_results = []
-
-        for fi in ctx.files:
-            if fi.error:
-                per_file_results.append({"role": fi.role, "status": "skipped"})
-                continue
-
-            try:
-                if fi.role == "endorsement_data":
-                    records = await self._extract_xls(fi, ctx)
-                elif fi.role == "endorsement_pdf":
-                    records = await self._extract_pdf(fi, ctx)
-                else:
-                    per_file_results.append({"role": fi.role, "status": "skipped", "reason": "unknown_role"})
-                    continue
-
-                fi.record_count = len(records)
-                ctx.raw_extracted_by_role[fi.role] = records
-                per_file_results.append({
-                    "role": fi.role, "filename": fi.filename,
-                    "records": len(records), "status": "ok",
-                })
-
-            except Exception as exc:
-                fi.error = str(exc)
-                ctx.add_error(f"ABHI extraction failed for {fi.filename}: {exc}")
-                per_file_results.append({
-                    "role": fi.role, "filename": fi.filename,
-                    "status": "failed", "error": str(exc),
-                })
+        # The XLS parse and the Gemini PDF roundtrip are independent, so
+        # run every file concurrently — wall clock becomes the slowest
+        # file instead of the sum. Each file writes a distinct role key,
+        # so the concurrent branches touch disjoint context slots.
+        per_file_results = list(
+            await asyncio.gather(
+                *(self._extract_file(fi, ctx) for fi in ctx.files)
+            )
+        )
 
         ctx.merge_extracted_to_flat()
         files_ok = sum(1 for r in per_file_results if r["status"] == "ok")
@@ -96,6 +102,34 @@ class ABHIExtractDataStep(PipelineStep):
             "per_file": per_file_results,
         })
 
+    async def _extract_file(self, fi: FileInfo, ctx: PipelineContext) -> dict[str, Any]:
+        """Extract one file by role; never raises — returns a per-file status dict."""
+        if fi.error:
+            return {"role": fi.role, "status": "skipped"}
+
+        try:
+            if fi.role == "endorsement_data":
+                records = await self._extract_xls(fi, ctx)
+            elif fi.role == "endorsement_pdf":
+                records = await self._extract_pdf(fi, ctx)
+            else:
+                return {"role": fi.role, "status": "skipped", "reason": "unknown_role"}
+
+            fi.record_count = len(records)
+            ctx.raw_extracted_by_role[fi.role] = records
+            return {
+                "role": fi.role, "filename": fi.filename,
+                "records": len(records), "status": "ok",
+            }
+
+        except Exception as exc:
+            fi.error = str(exc)
+            ctx.add_error(f"ABHI extraction failed for {fi.filename}: {exc}")
+            return {
+                "role": fi.role, "filename": fi.filename,
+                "status": "failed", "error": str(exc),
+            }
+
     # ─── Step 1: XLS Extraction ───────────────────────
 
     async def _extract_xls(self, fi: FileInfo, ctx: PipelineContext) -> list[dict[str, Any]]:
@@ -106,7 +140,10 @@ class ABHIExtractDataStep(PipelineStep):
         if not fi.local_path or fi.local_path.startswith("/tmp/pipeline/"):
             return self._xls_demo_data(fi.filename)
 
-        result = extract_xls(fi.local_path)
+        # openpyxl/xlrd parsing is synchronous CPU work — run it on a
+        # worker thread so the loop stays free for the concurrent PDF
+        # extraction and everything else on this worker.
+        result = await asyncio.to_thread(extract_xls, fi.local_path)
 
         ctx.set_extra("abhi_xls_header", result.get("header", {}))
         ctx.set_extra("abhi_xls_summary", result.get("summary", {}))
@@ -161,25 +198,26 @@ class ABHIExtractDataStep(PipelineStep):
             }]
 
         # ── Upload PDF and call Gemini ────────────────
-        from google import genai
+        from google.genai import types as genai_types
 
-        client = genai.Client(api_key=settings.GOOGLE_API_KEY)
+        client = _get_genai_client()
         model = settings.GEMINI_MODEL
 
         logger.info("Uploading PDF to Gemini", filepath=file_path, model=model)
 
-        # Upload the PDF file directly
-        uploaded_file = client.files.upload(file=file_path)
+        # Upload the PDF file directly — the async client surface keeps
+        # the event loop free while the bytes stream out.
+        uploaded_file = await client.aio.files.upload(file=file_path)
 
         logger.info("Calling Gemini with PDF", model=model, file_name=uploaded_file.name)
 
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model=model,
             contents=[
                 uploaded_file,
                 ENDORSEMENT_PDF_PROMPT,
             ],
-            config=genai.types.GenerateContentConfig(
+            config=genai_types.GenerateContentConfig(
                 system_instruction=SYSTEM_PROMPT,
                 temperature=settings.LLM_TEMPERATURE,
                 max_output_tokens=settings.LLM_MAX_TOKENS,
@@ -39,6 +39,10 @@ class PipelineStep(ABC):
     description: str = "No description"
     retryable: bool = False
     max_retries: int = 3
+    # Engine-enforced deadline for execute(); None means unbounded.
+    # Set on steps whose I/O can hang (HTTP, SFTP) so one stuck call
+    # can't stall the whole worker slot.
+    timeout_seconds: float | None = None
 
     @abstractmethod
     async def execute(self, ctx: PipelineContext) -> StepResult:
@@ -55,7 +59,12 @@ class PipelineStep(ABC):
         pass
 
     async def should_skip(self, ctx: PipelineContext) -> bool:
-        """Return True to skip this step.  Default: never skip."""
+        """Return True to skip this step.  Default: never skip.
+
+        MUST NOT raise — the engine calls this bare in its hot loop.
+        Subclasses whose skip check can fail (e.g. it probes the DB)
+        must catch locally and return False.
+        """
         return False
 
     # ─── Helpers available to all steps ────────────────
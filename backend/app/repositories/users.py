@@ -133,14 +133,18 @@ async def set_active_status(
 
 
 async def record_login(db: AsyncSession, user_id: int) -> None:
-    """Stamp `last_login_at` on successful authentication."""
+    """Stamp `last_login_at` on successful authentication.
+
+    Suitable for running after the response (e.g. via BackgroundTask with a
+    fresh session) — it touches nothing the login path reads back.
+    """
     stmt = (
         update(User)
         .where(User.id == user_id)
         .values(last_login_at=datetime.now(timezone.utc))
     )
+    # Core UPDATE executes immediately; no pending ORM state to flush.
     await db.execute(stmt)
-    await db.flush()
 
 
 # ─── Delete ──────────────────────────────────────────────
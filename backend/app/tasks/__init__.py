@@ -4,6 +4,14 @@ Celery application factory.
 
 from celery import Celery
 
+from app.core.config import settings
+from app.core.logging import setup_logging
+
+# Configure logging at import, mirroring app.main: workers run the
+# pipeline engine, whose level gates consult the stdlib logger, so
+# structlog and stdlib must agree on levels in worker processes too.
+setup_logging("DEBUG" if settings.APP_ENV == "development" else "INFO")
+
 celery_app = Celery("endorsements")
 celery_app.config_from_object("celeryconfig")
 
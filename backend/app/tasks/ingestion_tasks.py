@@ -3,6 +3,17 @@ Celery tasks — SFTP polling & file ingestion.
 """
 
 from app.tasks import celery_app
+from app.ingestion.file_fingerprint import compute_file_hash
+
+
+@celery_app.task(name="app.tasks.ingestion_tasks.fingerprint_file")
+def fingerprint_file(filepath: str, algorithm: str = "md5") -> str:
+    """Hash a downloaded file on a worker process.
+
+    Lets the poller fan hashing out across CPU cores instead of
+    serializing it on one event loop.
+    """
+    return compute_file_hash(filepath, algorithm)
 
 
 @celery_app.task(bind=True, name="app.tasks.ingestion_tasks.poll_sftp_for_insuree")
@@ -83,16 +83,25 @@ def process_file(
                 "business_rules": {},
             }
 
-        # Run the async pipeline engine in sync Celery context
+        # Run the async pipeline engine in sync Celery context. The persist
+        # layer caches one DB engine per event loop; dispose it before the
+        # asyncio.run() loop closes so pooled connections shut down cleanly.
         engine = PipelineEngine(flow_resolver=FlowResolver())
-        result: PipelineResult = asyncio.run(
-            engine.run(
-                file_ingestion_id=file_ingestion_id,
-                insuree_id=insuree_id,
-                insuree_config=insuree_config,
-                files=files,
-            )
-        )
+
+        async def _run() -> PipelineResult:
+            from app.pipeline.db_persist import dispose_persist_engine
+
+            try:
+                return await engine.run(
+                    file_ingestion_id=file_ingestion_id,
+                    insuree_id=insuree_id,
+                    insuree_config=insuree_config,
+                    files=files,
+                )
+            finally:
+                await dispose_persist_engine()
+
+        result: PipelineResult = asyncio.run(_run())
 
         task_log.info(
             "Processing task finished",